@@ -1,12 +1,15 @@
 import os
 import functools
-from flask import Flask, render_template, redirect, url_for, request, session, flash, g, app
-from flask_migrate import Migrate
+import click
+from flask.cli import AppGroup
+from flask import Flask, render_template, redirect, url_for, request, session, flash, g, app, jsonify, abort, Response, stream_with_context, send_file
 from urllib.parse import urlencode, quote, unquote
-from werkzeug.security import generate_password_hash, check_password_hash
-from flask_user import roles_required, UserManager
 from datetime import timedelta
+from sqlalchemy.orm import joinedload, load_only, selectinload, undefer
+from sqlalchemy.orm.exc import StaleDataError
 import datetime
+from importlib.util import find_spec
+from .pagination import keyset_page
 
 
 
@@ -15,6 +18,17 @@ def create_app(test_config=None):
     app = Flask(__name__)
     app.config.from_mapping(
         SECRET_KEY=os.environ.get('SECRET_KEY', default='dev'),
+        NOTES_PAGE_SIZE=20,
+        NOTES_MAX_PAGE_SIZE=100,
+        USERS_PAGE_SIZE=50,
+        NOTES_IMPORT_BATCH_SIZE=500,
+        SESSION_STORE_URL=None,
+        PRINCIPAL_TTL=300,
+        IMPORT_TIME_BUDGET_MS=700,
+        # Flask-User only provides its own /user/* pages here; processes that
+        # don't serve them (CLI commands, health checks) can skip importing it
+        # with USER_MANAGER_ENABLED=0 in the environment.
+        USER_MANAGER_ENABLED=os.environ.get('USER_MANAGER_ENABLED', '1') != '0',
     )
 
     if test_config is None:
@@ -22,11 +36,136 @@ def create_app(test_config=None):
     else:
         app.config.from_mapping(test_config)
 
-    from .models import db, User, Note, Role, UserRoles, Department, UserDepartments
-
-    user_manager = UserManager(app, db, User)
+    from .models import db, User, Note, Role, Department, unindexed_foreign_keys, note_etag
+    from .search import search_notes
+    from .memberships import (MEMBERSHIPS, add_members, assigned, available, ids_for_labels, member_ids, members,
+                              remove_members, search_users)
+    from .deletables import delete_url, label, resolve
+    from .export import export_ndjson, export_zip
+    from .importer import NoteImportError, import_notes, read_notes
+    from .passwords import HasherBusy, PasswordHasher
+    from .ratelimit import RateLimiter
+    from .sessions import Principal, PrincipalCache, ServerSideSessionInterface, store_from_url
+    from .assets import Assets
+    from .templating import FragmentCache, init_templates
+    from .lazymigrate import LazyMigrate
+    from .instrumentation import Instrumentation
+    from .profiling import Profiler, format_collapsed
+    from .replicas import Replicas
+
+    if app.config['USER_MANAGER_ENABLED']:
+        from flask_user import UserManager
+        UserManager(app, db, User)
+    # Adds the replica bind, so before db.init_app.
+    replicas = Replicas(app)
     db.init_app(app)
-    migrate = Migrate(app, db)
+    migrate = LazyMigrate(app, db)
+    Instrumentation(app)
+    hasher = PasswordHasher(app)
+    limiter = RateLimiter(app)
+
+    store = principals = None
+    if app.config['SESSION_STORE_URL']:
+        store = store_from_url(app.config['SESSION_STORE_URL'])
+        app.session_interface = ServerSideSessionInterface(store)
+        principals = PrincipalCache(store, app.config['PRINCIPAL_TTL'])
+    Assets(app)
+    app.jinja_env.globals['server_highlighting'] = find_spec('pygments') is not None
+    # Registers the {% cache %} tag, which precompiling base.html needs.
+    fragments = FragmentCache(app, store)
+    init_templates(app)
+
+    def invalidate_user_caches(user_ids):
+        # Names, roles or departments changed: cached principals and every
+        # cached navbar/dashboard fragment are stale.
+        if principals:
+            principals.invalidate(user_ids)
+        fragments.bump()
+
+    def delete_and_redirect(kind, object_id):
+        deletable, obj = resolve(kind, object_id)
+        user_ids = member_ids(kind, obj.id)
+        db.session.delete(obj)
+        db.session.commit()
+        invalidate_user_caches(user_ids)
+        flash(f"Successfully deleted {deletable.noun}: '{label(deletable, obj)}'", 'success')
+        return redirect(url_for(deletable.dashboard))
+
+    def render_confirm_delete(kind, object_id):
+        deletable, obj = resolve(kind, object_id)
+        return render_template('confirm_delete.html', variable=label(deletable, obj),
+                               variables_dashboard=deletable.dashboard, delete_url=delete_url(deletable, obj))
+
+    @app.cli.command('check-indexes')
+    def check_indexes():
+        """Fail if a model declares a foreign key without an index."""
+        missing = unindexed_foreign_keys()
+        for table, columns in missing:
+            click.echo(f"{table}({', '.join(columns)}) has no index", err=True)
+        if missing:
+            raise SystemExit(1)
+        click.echo('All foreign keys are indexed.')
+
+    @app.cli.command('check-import-time')
+    @click.option('--budget', default=lambda: app.config['IMPORT_TIME_BUDGET_MS'], type=float, show_default='IMPORT_TIME_BUDGET_MS')
+    def check_import_time(budget):
+        """Fail if a fresh process spends more than BUDGET ms importing
+        modules for create_app, as measured by python -X importtime."""
+        from .importtime import measure
+        total, modules = measure(app.import_name)
+        for name, ms in modules[:10]:
+            click.echo(f"{ms:8.1f} ms  {name}")
+        click.echo(f"{total:8.1f} ms  total (budget {budget:.0f} ms)")
+        if total > budget:
+            raise SystemExit(1)
+
+    @app.cli.command('sync-replica')
+    def sync_replica():
+        """Copy the primary SQLite database to SQLALCHEMY_REPLICA_URI, to try
+        replica routing locally with two SQLite files."""
+        if not app.config['SQLALCHEMY_REPLICA_URI']:
+            raise click.ClickException('SQLALCHEMY_REPLICA_URI is not set.')
+        try:
+            replicas.copy_sqlite()
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        click.echo('Replica updated.')
+
+    notes_cli = AppGroup('notes', help='Manage notes.')
+
+    @notes_cli.command('import')
+    @click.argument('path', type=click.Path(exists=True, dir_okay=False))
+    @click.option('--user', 'username', required=True, help='Owner of the imported notes.')
+    @click.option('--batch-size', default=lambda: app.config['NOTES_IMPORT_BATCH_SIZE'], type=int, show_default='NOTES_IMPORT_BATCH_SIZE')
+    @click.option('--restart', is_flag=True, help='Ignore the checkpoint left by an interrupted run.')
+    def import_command(path, username, batch_size, restart):
+        """Import notes from an NDJSON file or a ZIP of Markdown files."""
+        user = User.query.filter_by(username=username).first()
+        if user is None:
+            raise click.ClickException(f"No user named '{username}'.")
+
+        checkpoint = path + '.checkpoint'
+        skip = 0
+        if os.path.exists(checkpoint) and not restart:
+            with open(checkpoint) as f:
+                skip = int(f.read().strip() or 0)
+            click.echo(f"Resuming after {skip} records.")
+
+        def on_batch(result, committed):
+            with open(checkpoint, 'w') as f:
+                f.write(str(committed))
+            click.echo(f"{committed} records committed ({result.rate:.0f} notes/s)")
+
+        with open(path, 'rb') as stream:
+            try:
+                result = import_notes(read_notes(stream), user.id, batch_size=batch_size, skip=skip, on_batch=on_batch)
+            except NoteImportError as e:
+                raise click.ClickException(f"{e}. {e.committed} records are committed; run again to resume.")
+        if os.path.exists(checkpoint):
+            os.remove(checkpoint)
+        click.echo(f"Imported {result}.")
+
+    app.cli.add_command(notes_cli)
 
     def require_login(view):
         @functools.wraps(view)
@@ -43,17 +182,25 @@ def create_app(test_config=None):
     @app.before_request
     def load_user():
         user_id = session.get('user_id')
-        if user_id:
-            g.user = User.query.get(user_id)
-        else:
-            g.user = None
+        g.user = None
+        if user_id and principals:
+            g.user = principals.get(user_id)
+        if user_id and g.user is None:
+            g.user = User.query.options(
+                joinedload(User.roles), joinedload(User.departments)).filter_by(id=user_id).first()
+            if g.user and principals:
+                g.user = Principal.from_user(g.user)
+                principals.set(g.user)
     def make_session_permanent():
         session.permanent = True
         app.permanent_session_lifetime = timedelta(minutes=5)
 
+    profiler = Profiler(app)
+
 
 
     @app.route('/sign_up', methods=('GET', 'POST'))
+    @limiter.limit
     def sign_up():
         if request.method == 'POST':
             username = request.form['username']
@@ -68,7 +215,11 @@ def create_app(test_config=None):
                 error = 'Username is already taken.'
 
             if error is None:
-                user = User(username=username, password=generate_password_hash(password))
+                try:
+                    user = User(username=username, password=hasher.hash(password))
+                except HasherBusy:
+                    flash("We're busy right now, please try again in a moment.", 'error')
+                    return render_template('sign_up.html'), 503
                 db.session.add(user)
                 db.session.commit()
                 flash("Successfully signed up! Please log in.", 'success')
@@ -79,6 +230,7 @@ def create_app(test_config=None):
         return render_template('sign_up.html')
 
     @app.route('/log_in', methods=('GET', 'POST'))
+    @limiter.limit
     def log_in():
         if request.method == 'POST':
             username = request.form['username']
@@ -87,8 +239,21 @@ def create_app(test_config=None):
 
             user = User.query.filter_by(username=username).first()
 
-            if not user or not check_password_hash(user.password, password):
-                error = 'Username or password are incorrect'
+            try:
+                if not user or not hasher.check(user.password, password):
+                    error = 'Username or password are incorrect'
+            except HasherBusy:
+                flash("We're busy right now, please try again in a moment.", 'error')
+                return render_template('log_in.html'), 503
+
+            if error is None and hasher.needs_rehash(user.password):
+                # Upgrading the hash can wait for a quieter login; a busy
+                # hasher mustn't turn a correct password into a 503.
+                try:
+                    user.password = hasher.hash(password)
+                    db.session.commit()
+                except HasherBusy:
+                    pass
 
             if error is None:
                 session.clear()
@@ -117,7 +282,70 @@ def create_app(test_config=None):
     @app.route('/notes')
     @require_login
     def note_index():
-        return render_template('note_index.html', notes=g.user.notes)
+        per_page = request.args.get('per_page', app.config['NOTES_PAGE_SIZE'], type=int)
+        per_page = max(1, min(per_page, app.config['NOTES_MAX_PAGE_SIZE']))
+        query = Note.query.filter_by(user_id=g.user.id).options(
+            load_only(Note.id, Note.title, Note.updated_at), undefer(Note.excerpt))
+        notes = keyset_page(query, [Note.updated_at, Note.id], per_page,
+                            after=request.args.get('after'), before=request.args.get('before'))
+        return render_template('note_index.html', notes=notes, per_page=per_page)
+
+    @app.route('/notes/search')
+    @require_login
+    def note_search():
+        q = request.args.get('q', '')
+        page = max(1, request.args.get('page', 1, type=int))
+        per_page = app.config['NOTES_PAGE_SIZE']
+        results, has_next = search_notes(g.user.id, q, page=page, per_page=per_page)
+        return render_template('note_search.html', q=q, results=results, page=page, has_next=has_next)
+
+    @app.route('/notes/export')
+    @require_login
+    def note_export():
+        export_format = request.args.get('format', 'ndjson')
+        if export_format not in ('ndjson', 'zip'):
+            abort(404)
+        everyone = bool(request.args.get('all')) and g.user.is_admin
+
+        query = Note.query.options(
+            load_only(Note.id, Note.user_id, Note.title, Note.body, Note.created_at, Note.updated_at))
+        if not everyone:
+            query = query.filter_by(user_id=g.user.id)
+        query = query.order_by(Note.id)
+
+        if export_format == 'zip':
+            body, mimetype = export_zip(query, with_author=everyone), 'application/zip'
+        else:
+            body, mimetype = export_ndjson(query, with_author=everyone), 'application/x-ndjson'
+        filename = 'notes.%s' % export_format
+        return Response(stream_with_context(body), mimetype=mimetype,
+                        headers={'Content-Disposition': 'attachment; filename=%s' % filename})
+
+    @app.route('/notes/import', methods=('GET', 'POST'))
+    @require_login
+    def note_import():
+        if request.method == 'POST':
+            upload = request.files.get('file')
+            skip = max(0, request.form.get('skip', 0, type=int))
+            error = None
+
+            if not upload or not upload.filename:
+                error = 'Choose a file to import.'
+
+            if not error:
+                try:
+                    result = import_notes(read_notes(upload.stream), g.user.id,
+                                          batch_size=app.config['NOTES_IMPORT_BATCH_SIZE'], skip=skip)
+                except NoteImportError as e:
+                    flash(f"Import stopped: {e}. The first {e.committed} records are saved; "
+                          f"upload the same file again to resume.", 'error')
+                    return render_template('note_import.html', skip=e.committed)
+                flash(f"Successfully imported {result}.", 'success')
+                return redirect(url_for('note_index'))
+
+            flash(error, 'error')
+
+        return render_template('note_import.html', skip=0)
 
     @app.route('/notes/new', methods=('GET', 'POST'))
     @require_login
@@ -131,7 +359,8 @@ def create_app(test_config=None):
                 error = 'Title is required.'
 
             if not error:
-                note = Note(author=g.user, title=title, body=body)
+                note = Note(user_id=g.user.id, title=title, body=body)
+                note.render()
                 db.session.add(note)
                 db.session.commit()
                 flash(f"Successfully created note: '{title}'", 'success')
@@ -156,8 +385,15 @@ def create_app(test_config=None):
             if not error:
                 note.title = title
                 note.body = body
+                note.render()
                 db.session.add(note)
-                db.session.commit()
+                try:
+                    db.session.commit()
+                except StaleDataError:
+                    db.session.rollback()
+                    flash('This note was changed while you were editing it. Reload it and make your changes again.',
+                          'error')
+                    return render_template('note_update.html', note=note), 409
                 flash(f"Successfully updated note: '{title}'", 'success')
                 return redirect(url_for('note_index'))
 
@@ -174,28 +410,177 @@ def create_app(test_config=None):
         flash(f"Successfully deleted note: '{note.title}'", 'success')
         return redirect(url_for('note_index'))
 
+    def api_require_login(view):
+        @functools.wraps(view)
+        def wrapped_view(**kwargs):
+            if not g.user:
+                return jsonify(error='Authentication required.'), 401
+            return view(**kwargs)
+        return wrapped_view
+
+    def api_admin_required(view):
+        @functools.wraps(view)
+        def wrapped_view(**kwargs):
+            if not g.user.is_admin:
+                return jsonify(error='Admin access required.'), 403
+            return view(**kwargs)
+        return wrapped_view
+
+    def json_payload():
+        # {} for an empty body. None for anything else that isn't a JSON
+        # object: the wrong content type, JSON that doesn't parse, a list.
+        if not request.get_data():
+            return {}
+        if not request.is_json:
+            return None
+        payload = request.get_json(silent=True)
+        return payload if isinstance(payload, dict) else None
+
+    def note_fields_error(payload):
+        for field in ('title', 'body'):
+            value = payload.get(field)
+            if value is not None and not isinstance(value, str):
+                return f'{field} must be a string.'
+        return None
+
+    def note_response(note, status=200):
+        response = jsonify(note.to_dict())
+        response.status_code = status
+        response.set_etag(note.etag)
+        return response
+
+    @app.route('/api/v1/notes', methods=('GET', 'POST'))
+    @api_require_login
+    def api_notes():
+        if request.method == 'POST':
+            payload = json_payload()
+            if payload is None:
+                return jsonify(error='Expected a JSON object.'), 400
+            error = note_fields_error(payload)
+            if error:
+                return jsonify(error=error), 400
+            title = payload.get('title')
+            body = payload.get('body') or ''
+
+            if not title:
+                return jsonify(error='Title is required.'), 400
+
+            note = Note(user_id=g.user.id, title=title, body=body)
+            note.render()
+            db.session.add(note)
+            db.session.commit()
+            response = note_response(note, 201)
+            response.headers['Location'] = url_for('api_note', note_id=note.id)
+            return response
+
+        per_page = request.args.get('per_page', app.config['NOTES_PAGE_SIZE'], type=int)
+        per_page = max(1, min(per_page, app.config['NOTES_MAX_PAGE_SIZE']))
+        query = Note.query.filter_by(user_id=g.user.id).options(
+            load_only(Note.id, Note.title, Note.created_at, Note.updated_at, Note.version))
+        notes = keyset_page(query, [Note.updated_at, Note.id], per_page,
+                            after=request.args.get('after'), before=request.args.get('before'))
+        response = jsonify(
+            notes=[{'id': note.id, 'title': note.title, 'updated_at': note.updated_at.isoformat(),
+                    'etag': note.etag, 'url': url_for('api_note', note_id=note.id)} for note in notes],
+            next=notes.next_cursor,
+            prev=notes.prev_cursor,
+        )
+        response.add_etag()
+        return response.make_conditional(request)
+
+    @app.route('/api/v1/notes/<int:note_id>', methods=('GET', 'PUT', 'PATCH', 'DELETE'))
+    @api_require_login
+    def api_note(note_id):
+        if request.method == 'GET':
+            # Answer revalidations from (id, version) alone, before the body is read.
+            row = db.session.query(Note.version).filter_by(id=note_id, user_id=g.user.id).first()
+            if row is None:
+                return jsonify(error='Note not found.'), 404
+            etag = note_etag(note_id, row.version)
+            if request.if_none_match.contains_weak(etag):
+                response = app.response_class(status=304)
+                response.set_etag(etag)
+                return response
+            return note_response(Note.query.get(note_id))
+
+        note = Note.query.filter_by(id=note_id, user_id=g.user.id).with_for_update().first()
+        if note is None:
+            return jsonify(error='Note not found.'), 404
+        if request.if_match and not request.if_match.contains(note.etag):
+            return jsonify(error='Note was modified by someone else.'), 412
+
+        if request.method == 'DELETE':
+            db.session.delete(note)
+            try:
+                db.session.commit()
+            except StaleDataError:
+                db.session.rollback()
+                return jsonify(error='Note was modified by someone else.'), 412
+            return '', 204
+
+        payload = json_payload()
+        if payload is None:
+            return jsonify(error='Expected a JSON object.'), 400
+        error = note_fields_error(payload)
+        if error:
+            return jsonify(error=error), 400
+        if request.method == 'PUT' and 'title' not in payload:
+            return jsonify(error='Title is required.'), 400
+        if 'title' in payload and not payload['title']:
+            return jsonify(error='Title is required.'), 400
+
+        if 'title' in payload:
+            note.title = payload['title']
+        if 'body' in payload:
+            note.body = payload['body'] or ''
+        elif request.method == 'PUT':
+            note.body = ''
+        note.render()
+        db.session.add(note)
+        try:
+            db.session.commit()
+        except StaleDataError:
+            # Another write got in between loading and saving; SQLite ignores
+            # with_for_update(), so the version check is what catches it.
+            db.session.rollback()
+            return jsonify(error='Note was modified by someone else.'), 412
+        return note_response(note)
+
     def admin_required(f):
         @functools.wraps(f)
         def wrap(*args, **kwargs):
-            if g.user.roles:
-                for role in g.user.roles:
-                    if 'Admin' in role.name:
-                        return f(*args, **kwargs)
-                    else:
-                        flash(u"You need to be an admin to view this page.", 'error')
-                        return redirect(url_for('index'))
-            else:
-                flash(u"You need to be an admin to view this page.", 'error')
-                return redirect(url_for('index'))
+            if g.user and g.user.is_admin:
+                return f(*args, **kwargs)
+            flash(u"You need to be an admin to view this page.", 'error')
+            return redirect(url_for('index'))
         return wrap
 
     @app.route('/users')
     @require_login
     @admin_required
     def users_dashboard(user_id='g.user.id'):
-        user_id = session.get('user_id')
-        users = User.query.all()
-        return render_template('users_dashboard.html', Users=users)
+        sort_columns = {'id': User.id, 'username': User.username, 'created_at': User.created_at}
+        sort = request.args.get('sort', 'id')
+        if sort not in sort_columns:
+            sort = 'id'
+        order = 'desc' if request.args.get('order') == 'desc' else 'asc'
+        role_id = request.args.get('role', type=int)
+        department_id = request.args.get('department', type=int)
+
+        query = User.query.options(selectinload(User.roles), selectinload(User.departments))
+        if role_id:
+            query = query.filter(User.roles.any(Role.id == role_id))
+        if department_id:
+            query = query.filter(User.departments.any(Department.id == department_id))
+        column = sort_columns[sort]
+        query = query.order_by(column.desc() if order == 'desc' else column.asc(), User.id)
+
+        users = query.paginate(page=request.args.get('page', 1, type=int),
+                               per_page=app.config['USERS_PAGE_SIZE'], error_out=False)
+        filters = dict(sort=sort, order=order, role=role_id, department=department_id)
+        return render_template('users_dashboard.html', Users=users.items, pagination=users, filters=filters,
+                               roles=Role.query.order_by(Role.name).all(),
+                               departments=Department.query.order_by(Department.title).all())
 
     @app.route('/users/new', methods=('GET', 'POST'))
     @require_login
@@ -224,50 +609,33 @@ def create_app(test_config=None):
     @admin_required
     def user_update(user_id):
         user = User.query.filter_by(id=user_id).first_or_404()
-        roles = Role.query.all()
-        departments = Department.query.all()
-        rest = compare(user.departments, departments)
         if request.method in ['POST', 'PATCH']:
             username = request.form['username']
-            name = request.form['name']
-            title = request.form['title']
             error = None
 
             if not username:
                 error = 'Username is required.'
+            elif username != user.username and User.query.filter_by(username=username).first() is not None:
+                error = 'Username is already taken.'
 
             if not error:
                 user.username = username
                 db.session.add(user)
-                updated_user = User.query.filter_by(username=username).first_or_404()
-                department = Department.query.filter_by(title=title).first_or_404
-                role = Role.query.filter_by(name=name).first_or_404()
-                if (name and title) == 'None':
-                    return render_template('user_update.html', user=user, user_id=user.id, roles=roles, departments=departments)
-                elif 'None' in name:
-                    updated_user.departments.append(department)
-                    db.session.add(updated_user)
-                    db.session.commit()
-                    flash(f"Successfully added role: '{role.name}' to the user: '{username}'", 'success')
-                    return render_template('user_update.html', user_id=user.id)
-                elif 'None' in title:
-                    updated_user.roles.append(role)
-                    db.session.add(updated_user)
-                    db.session.commit()
-                    flash(f"Successfully added role: '{role.name}' to the user: '{username}'", 'success')
-                    return render_template('user_update.html', user_id=user.id)
-                else:
-                    updated_user.departments.append(department)
-                    updated_user.roles.append(role)
-                    db.session.add(updated_user)
-                    db.session.commit()
-#                    flash(f"{user_name}, {updated_user}, {updated_user.roles[0].name}")
-                    flash(f"Successfully added role: '{role.name}' and department '{department.title}' to the user '{user.username}'", 'success')
-                    return render_template('user_update.html', user_id=user.id)
-
-            flash(error, 'error')
+                # Every add and remove is one set-based statement per kind.
+                for kind, field in (('roles', 'name'), ('departments', 'title')):
+                    labels = [label for label in request.form.getlist(field) if label != 'None']
+                    add_members(kind, [user.id], ids_for_labels(kind, labels))
+                    remove_members(kind, [user.id], request.form.getlist('remove_' + kind, type=int))
+                db.session.commit()
+                invalidate_user_caches([user.id])
+                flash(f"Successfully updated user: '{username}'", 'success')
+            else:
+                flash(error, 'error')
 
-        return render_template('user_update.html', user=user, roles=roles, departments=departments)
+        return render_template('user_update.html', user=user,
+                               roles=assigned('roles', user.id), available_roles=available('roles', user.id),
+                               departments=assigned('departments', user.id),
+                               available_departments=available('departments', user.id))
 
     @app.route('/roles')
     @require_login
@@ -302,7 +670,6 @@ def create_app(test_config=None):
     @require_login
     def role_update(role_id):
         role = Role.query.filter_by(id=role_id).first_or_404()
-        users = User.query.all()
         if request.method in ['POST', 'PATCH']:
             name = request.form['name']
             user_name = request.form.get('user_name')
@@ -315,20 +682,24 @@ def create_app(test_config=None):
                 role.name = name
                 db.session.add(role)
                 flash(f"Successfully updated role: '{name}'", 'success')
-                if user_name == "None":
+                if not user_name or user_name == "None":
                     db.session.commit()
-                    return render_template('role_update.html', role=role, users=users)
+                    invalidate_user_caches(member_ids('roles', role.id))
+                    return render_template('role_update.html', role=role, members=members('roles', role.id))
                 else:
                     updated_user = User.query.filter_by(username=user_name).first_or_404()
-                    updated_user.roles.append(role)
+                    # The name is typed now, so it may already be a member.
+                    if role not in updated_user.roles:
+                        updated_user.roles.append(role)
                     db.session.add(updated_user)
                     db.session.commit()
+                    invalidate_user_caches(member_ids('roles', role.id))
                     flash(f"{user_name}, {updated_user}, {updated_user.roles[0].name}")
-                    return render_template('role_update.html', role=role, users=users)
+                    return render_template('role_update.html', role=role, members=members('roles', role.id))
 
             flash(error, 'error')
 
-        return render_template('role_update.html', role=role, users=users)
+        return render_template('role_update.html', role=role, members=members('roles', role.id))
 
     @app.route('/roles/<role_id>/<user_id>/delete', methods=('GET', 'DELETE'))
     @require_login
@@ -336,12 +707,12 @@ def create_app(test_config=None):
     def user_role_delete(role_id, user_id):
         role = Role.query.filter_by(id=role_id).first_or_404()
         user = User.query.filter_by(id=user_id).first_or_404()
-        users = User.query.all()
         user.roles.remove(role)
         db.session.add(user)
         db.session.commit()
+        invalidate_user_caches([user.id])
         flash(f"Successfully deleted role \"{role.name}\" from user \"{user.username}\"", 'success')
-        return render_template('role_update.html', role=role, users=users)
+        return render_template('role_update.html', role=role, members=members('roles', role.id))
 
     @app.route('/departments')
     @require_login
@@ -376,7 +747,6 @@ def create_app(test_config=None):
     @require_login
     def department_update(department_id):
         department = Department.query.filter_by(id=department_id).first_or_404()
-        users = User.query.all()
         if request.method in ['POST', 'PATCH']:
             title = request.form['title']
             user_name = request.form.get('user_name')
@@ -389,37 +759,38 @@ def create_app(test_config=None):
                 department.title = title
                 db.session.add(department)
                 flash(f"Successfully updated department: '{title}'", 'success')
-                if user_name == "None":
+                if not user_name or user_name == "None":
                     db.session.commit()
-                    return render_template('department_update.html', department=department, users=users)
+                    invalidate_user_caches(member_ids('departments', department.id))
+                    return render_template('department_update.html', department=department,
+                                           members=members('departments', department.id))
                 else:
                     updated_user = User.query.filter_by(username=user_name).first_or_404()
-                    updated_user.departments.append(department)
+                    if department not in updated_user.departments:
+                        updated_user.departments.append(department)
                     db.session.add(updated_user)
                     db.session.commit()
+                    invalidate_user_caches([updated_user.id])
                     flash(f"{user_name}, {updated_user}, {updated_user.departments[0].title}")
-                    return render_template('department_update.html', department=department, users=users)
+                    return render_template('department_update.html', department=department,
+                                           members=members('departments', department.id))
 
             flash(error, 'error')
 
-        return render_template('department_update.html', department=department, users=users)
+        return render_template('department_update.html', department=department,
+                               members=members('departments', department.id))
 
     @app.route('/departments/<department_id>/delete', methods=('GET', 'DELETE'))
     @require_login
     @admin_required
     def department_delete(department_id):
-        department = Department.query.filter_by(id=department_id).first_or_404()
-        db.session.delete(department)
-        db.session.commit()
-        flash(f"Successfully deleted department: '{department.title}'", 'success')
-        return redirect(url_for('departments_dashboard'))
+        return delete_and_redirect('departments', department_id)
 
     @app.route('/departments/<department_id>/delete/confirm', methods=('GET', 'POST'))
     @require_login
     @admin_required
     def confirm_delete_department(department_id):
-        department = Department.query.filter_by(id=department_id).first_or_404()
-        return render_template('confirm_delete_department.html', department=department)
+        return render_confirm_delete('departments', department_id)
 
     @app.route('/departments/<department_id>/<user_id>/delete', methods=('GET', 'DELETE'))
     @require_login
@@ -427,55 +798,113 @@ def create_app(test_config=None):
     def user_department_delete(department_id, user_id):
         department = Department.query.filter_by(id=department_id).first_or_404()
         user = User.query.filter_by(id=user_id).first_or_404()
-        users = User.query.all()
         user.departments.remove(department)
         db.session.add(user)
         db.session.commit()
+        invalidate_user_caches([user.id])
         flash(f"Successfully deleted department \"{department.title}\" from user \"{user.username}\"", 'success')
-        return render_template('department_update.html', department=department, users=users)
+        return render_template('department_update.html', department=department,
+                               members=members('departments', department.id))
 
     @app.route('/roles/<role_id>/delete/confirm', methods=('GET', 'POST'))
     @require_login
     @admin_required
     def confirm_delete_role(role_id):
-        role = Role.query.filter_by(id=role_id).first_or_404()
-        return render_template('confirm_delete_role.html', role=role)
+        return render_confirm_delete('roles', role_id)
 
     @app.route('/roles/<role_id>/delete', methods=('GET', 'DELETE'))
     @require_login
     @admin_required
     def role_delete(role_id):
-        role = Role.query.filter_by(id=role_id).first_or_404()
-        db.session.delete(role)
-        db.session.commit()
-        flash(f"Successfully deleted role: '{role.name}'", 'success')
-        return redirect(url_for('roles_dashboard'))
+        return delete_and_redirect('roles', role_id)
 
-    @app.route('/<variable>/<variable_id>/delete/confirm', methods=('GET', 'POST'))
+    @app.route('/admin/metrics')
     @require_login
     @admin_required
-    def confirm_delete(variable_id, variable):
-        departments = Department.query.all()
-        roles = Role.query.all()
-
-        for department in departments:
-            if department.title in variable:
-                variable = Department.query.filter_by(id=variable_id).first_or_404().title
-                variables_dashboard = "departments_dashboard"
-                return render_template('confirm_delete.html', variable=variable, variables_dashboard=variables_dashboard)
-
-        for role in roles:
-            if role.name in variable:
-                variable = Role.query.filter_by(id=variable_id).first_or_404().name
-                variables_dashboard = "roles_dashboard"
-                return render_template('confirm_delete.html', variable=variable, variables_dashboard=variables_dashboard)
+    def admin_metrics():
+        return jsonify(password_hashing=hasher.stats())
 
+    @app.route('/admin/profiles')
+    @require_login
+    @admin_required
+    def admin_profiles():
+        return jsonify(profiles=profiler.list())
 
-    def compare(list1, list2):
-        set_difference = set(list1) - set(list2)
-        list_difference = list(set_difference)
-        return list_difference
+    @app.route('/admin/profiles/<name>')
+    @require_login
+    @admin_required
+    def admin_profile(name):
+        path = profiler.path(name)
+        if path is None:
+            abort(404)
+        return send_file(path, mimetype='text/plain' if name.endswith('.collapsed') else 'application/octet-stream',
+                         as_attachment=name.endswith('.prof'))
+
+    @app.route('/admin/profile/workers', methods=('POST',))
+    @require_login
+    @admin_required
+    def admin_profile_workers():
+        seconds = request.args.get('seconds', 10, type=float)
+        stacks, workers = profiler.sample_workers(seconds)
+        return Response(format_collapsed(stacks), mimetype='text/plain',
+                        headers={'X-Profile-Workers': str(workers)})
+
+    @app.route('/api/v1/users/search')
+    @api_require_login
+    @api_admin_required
+    def api_user_search():
+        prefix = request.args.get('q', '').strip()
+        limit = max(1, min(request.args.get('limit', 10, type=int), 50))
+        not_in = None
+        kind = request.args.get('not_in')
+        if kind:
+            target_id = request.args.get('id', type=int)
+            if kind not in MEMBERSHIPS or target_id is None:
+                return jsonify(error='not_in must be one of %s, with an integer id' % ', '.join(MEMBERSHIPS)), 400
+            not_in = (kind, target_id)
+        if not prefix:
+            return jsonify(users=[])
+        users = search_users(prefix, limit, not_in)
+        return jsonify(users=[dict(id=user_id, username=username) for user_id, username in users])
+
+    @app.route('/api/v1/<kind>/members', methods=('POST', 'DELETE'))
+    @api_require_login
+    @api_admin_required
+    def bulk_members(kind):
+        if kind not in MEMBERSHIPS:
+            abort(404)
+        payload = request.get_json(silent=True)
+        try:
+            if payload is not None:
+                user_ids, target_ids = payload.get('user_ids', []), payload.get('ids', [])
+                # int() over a string would walk it digit by digit.
+                if not isinstance(user_ids, list) or not isinstance(target_ids, list):
+                    raise TypeError
+                user_ids = [int(i) for i in user_ids]
+                target_ids = [int(i) for i in target_ids]
+            else:
+                user_ids = request.form.getlist('user_ids', type=int)
+                target_ids = request.form.getlist('ids', type=int)
+        except (TypeError, ValueError, AttributeError):
+            return jsonify(error='user_ids and ids must be lists of integers'), 400
+        if not user_ids or not target_ids:
+            return jsonify(error='user_ids and ids are required'), 400
 
+        if request.method == 'POST':
+            count = add_members(kind, user_ids, target_ids)
+            result = dict(added=count)
+        else:
+            count = remove_members(kind, user_ids, target_ids)
+            result = dict(removed=count)
+        db.session.commit()
+        invalidate_user_caches(user_ids)
+        return jsonify(result)
 
+    @app.route('/<variable>/<variable_id>/delete/confirm', methods=('GET', 'POST'))
+    @require_login
+    @admin_required
+    def confirm_delete(variable_id, variable):
+        # ``variable`` is a key of deletables.DELETABLES, e.g. "departments".
+        return render_confirm_delete(variable, variable_id)
 
     return app
@@ -0,0 +1,133 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+
+from flask import abort, request, send_file, send_from_directory
+from flask.sessions import SessionInterface
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+IMMUTABLE = 'public, max-age=31536000, immutable'
+
+
+def _write_atomically(path, data):
+    # Workers starting together may build the same file while another one is
+    # already serving it: never let a reader see it half written.
+    tmp = '%s.%d.tmp' % (path, os.getpid())
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+class StaticSessionInterface(SessionInterface):
+    """Gives requests for static files a null session, which Flask never
+    saves; everything else goes to the wrapped interface."""
+
+    def __init__(self, wrapped):
+        self.wrapped = wrapped
+
+    def open_session(self, app, request):
+        # Runs before URL matching, so request.endpoint isn't known yet.
+        if app.static_url_path and request.path.startswith(app.static_url_path + '/'):
+            return self.make_null_session(app)
+        return self.wrapped.open_session(app, request)
+
+    def save_session(self, app, session, response):
+        return self.wrapped.save_session(app, session, response)
+
+
+class Assets(object):
+    """Content-hashed, precompressed static files.
+
+    At startup every file under the static folder gets a fingerprinted name
+    (``app.3f2a9c1b04de.js``) and ``.gz``/``.br`` copies in ASSETS_BUILD_DIR.
+    ``url_for('static', filename=...)`` emits the fingerprinted name, which
+    is served with an immutable Cache-Control and the best precompressed
+    body the client accepts. ``.br`` needs the optional ``brotli`` package.
+    Call it after setting ``app.session_interface``.
+    """
+
+    def __init__(self, app=None):
+        self.manifest = {}
+        self.originals = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('ASSETS_FINGERPRINT', True)
+        app.config.setdefault('ASSETS_BUILD_DIR', os.path.join(app.instance_path, 'assets'))
+        self.static_folder = app.static_folder
+        self.build_dir = app.config['ASSETS_BUILD_DIR']
+        app.extensions['assets'] = self
+        if not app.config['ASSETS_FINGERPRINT'] or not self.static_folder:
+            return
+        self.build()
+        app.url_defaults(self._url_defaults)
+        app.view_functions['static'] = self.serve
+        # Static files don't depend on the user: answer before any other
+        # before_request hook and without a session, which Flask-User and
+        # Flask-Login would otherwise touch, adding Vary: Cookie and a
+        # Set-Cookie to publicly cacheable responses.
+        app.before_request_funcs.setdefault(None, []).insert(0, self._serve_early)
+        app.session_interface = StaticSessionInterface(app.session_interface)
+
+    def build(self):
+        os.makedirs(self.build_dir, exist_ok=True)
+        for root, dirs, files in os.walk(self.static_folder):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            for name in files:
+                if name.startswith('.'):
+                    continue
+                path = os.path.join(root, name)
+                filename = os.path.relpath(path, self.static_folder).replace(os.sep, '/')
+                with open(path, 'rb') as f:
+                    data = f.read()
+                digest = hashlib.sha256(data).hexdigest()[:12]
+                stem, ext = os.path.splitext(filename)
+                hashed = '%s.%s%s' % (stem, digest, ext)
+                self.manifest[filename] = hashed
+                self.originals[hashed] = filename
+                self._compress(hashed, data)
+
+    def _compress(self, hashed, data):
+        target = os.path.join(self.build_dir, hashed)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        # Names carry the content hash, so existing files are up to date.
+        if not os.path.exists(target + '.gz'):
+            _write_atomically(target + '.gz', gzip.compress(data, 9))
+        if brotli is not None and not os.path.exists(target + '.br'):
+            _write_atomically(target + '.br', brotli.compress(data))
+
+    def _url_defaults(self, endpoint, values):
+        if endpoint == 'static' and 'filename' in values:
+            values['filename'] = self.manifest.get(values['filename'], values['filename'])
+
+    def _serve_early(self):
+        if request.endpoint == 'static':
+            return self.serve(**request.view_args)
+
+    def serve(self, filename):
+        original = self.originals.get(filename)
+        if original is None:
+            return send_from_directory(self.static_folder, filename)
+
+        mimetype = mimetypes.guess_type(original)[0] or 'application/octet-stream'
+        accepted = request.accept_encodings
+        for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+            path = os.path.join(self.build_dir, filename + suffix)
+            if accepted[encoding] and os.path.exists(path):
+                response = send_file(path, mimetype=mimetype, conditional=True)
+                response.headers['Content-Encoding'] = encoding
+                break
+        else:
+            path = os.path.join(self.static_folder, original)
+            if not os.path.isfile(path):
+                abort(404)
+            response = send_file(path, mimetype=mimetype, conditional=True)
+        response.headers['Cache-Control'] = IMMUTABLE
+        response.vary.add('Accept-Encoding')
+        return response
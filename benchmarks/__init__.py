@@ -0,0 +1,12 @@
+"""Benchmarks for the app's hot paths, run through the Flask test client.
+
+Run them from the directory that contains the checkout, e.g. for ``notes/``::
+
+    python -m notes.benchmarks run --scale 1k --out before.json
+    python -m notes.benchmarks run --scale 1k --out after.json
+    python -m notes.benchmarks compare before.json after.json --threshold 0.1
+
+Each run builds the app with create_app(test_config), seeds a SQLite file
+(or the database given with --database-url, whose tables are dropped) and
+writes latency percentiles and throughput per scenario as JSON.
+"""
@@ -0,0 +1,56 @@
+import argparse
+import json
+import sys
+
+from . import runner
+from .seed import SCALES
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='benchmarks', description='Benchmark the notes app hot paths.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='Seed a database and time every scenario.')
+    run.add_argument('--scale', choices=sorted(SCALES), default='1k')
+    run.add_argument('--database-url', help='Database to use instead of a SQLite file in the temp '
+                                            'directory, e.g. a local Postgres. Its tables are dropped.')
+    run.add_argument('--iterations', type=int, default=200)
+    run.add_argument('--warmup', type=int, default=20)
+    run.add_argument('--scenario', action='append', dest='only',
+                     choices=[scenario.__name__ for scenario in runner.SCENARIOS])
+    run.add_argument('--fresh', action='store_true', help='Re-seed even if the database is already seeded.')
+    run.add_argument('--seed', type=int, default=0,
+                     help='Seeds both the generated data and the scenarios. Pass --fresh too '
+                          'when reusing a --database-url seeded with another value.')
+    run.add_argument('--out', help='Write the results here as JSON.')
+
+    compare = commands.add_parser('compare', help='Flag scenarios that got slower.')
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('--threshold', type=float, default=0.1,
+                         help='Allowed slowdown as a ratio (default: 0.1, i.e. 10%%).')
+    compare.add_argument('--metric', default='p50_ms', choices=['mean_ms', 'p50_ms', 'p90_ms', 'p99_ms'])
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        result = runner.run(args.scale, args.database_url, args.iterations, args.warmup,
+                            args.only, args.fresh, args.seed)
+        if args.out:
+            with open(args.out, 'w') as f:
+                json.dump(result, f, indent=2, sort_keys=True)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    rows, regressions = runner.compare(baseline, current, args.threshold, args.metric)
+    for name, before, after, change in rows:
+        flag = '  REGRESSION' if change > args.threshold else ''
+        print('%-18s %10.2f -> %10.2f ms  %+7.1f%%%s' % (name, before, after, change * 100, flag))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,196 @@
+import datetime
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from importlib.metadata import version
+
+from .. import create_app
+from ..models import db, User, Note, Department
+from . import seed as seeding
+
+
+def build_app(database_url, workdir):
+    return create_app({
+        'SQLALCHEMY_DATABASE_URI': database_url,
+        'SECRET_KEY': 'benchmark',
+        'USER_ENABLE_EMAIL': False,
+        'RATELIMIT_ENABLED': False,
+        # Hash inline: the test client is single-threaded anyway.
+        'PASSWORD_HASH_WORKERS': 0,
+        'ASSETS_BUILD_DIR': os.path.join(workdir, 'assets'),
+        'TEMPLATE_CACHE_DIR': os.path.join(workdir, 'jinja'),
+        'PROFILE_DIR': os.path.join(workdir, 'profiles'),
+    })
+
+
+def prepare(app, notes, fresh, seed=0):
+    """Seed the database unless it already holds this scale's data."""
+    with app.app_context():
+        if not fresh and seeding.is_seeded(notes):
+            return False
+        db.drop_all()
+        db.create_all()
+        password_hash = app.extensions['password_hasher'].hash(seeding.BENCH_PASSWORD)
+        seeding.seed(notes, password_hash, seed)
+        return True
+
+
+class Fixture(object):
+    """Ids the scenarios pick from, loaded once per run."""
+
+    def __init__(self, app, rng):
+        self.rng = rng
+        with app.app_context():
+            self.note_ids = [note_id for note_id, in db.session.query(Note.id).filter_by(user_id=1).limit(1000)]
+            self.departments = [(d.id, d.title) for d in Department.query.all()]
+            self.users = db.session.query(db.func.count(User.id)).scalar()
+            self.user_pages = max(1, self.users // app.config['USERS_PAGE_SIZE'])
+        self.revision = 0
+
+
+def _expect(response, *statuses):
+    if response.status_code not in statuses:
+        raise AssertionError('%s %s -> %s' % (response.request.method, response.request.path, response.status))
+    return response
+
+
+def note_index(client, fixture):
+    _expect(client.get('/notes'), 200)
+
+
+def note_update(client, fixture):
+    fixture.revision += 1
+    note_id = fixture.rng.choice(fixture.note_ids)
+    _expect(client.post('/notes/%d/edit' % note_id, data={
+        'title': 'Note %d' % note_id,
+        'body': '%s\n\nRevision %d.' % (seeding.BODIES[fixture.revision % len(seeding.BODIES)], fixture.revision),
+    }), 302)
+
+
+def log_in(client, fixture):
+    with client.application.test_client() as anonymous:
+        _expect(anonymous.post('/log_in', data={'username': seeding.BENCH_USER,
+                                                'password': seeding.BENCH_PASSWORD}), 302)
+
+
+def users_dashboard(client, fixture):
+    _expect(client.get('/users?page=%d' % fixture.rng.randint(1, fixture.user_pages)), 200)
+
+
+def user_update(client, fixture):
+    _expect(client.get('/users/%d/edit' % fixture.rng.randint(2, fixture.users)), 200)
+
+
+def department_update(client, fixture):
+    department_id, _ = fixture.rng.choice(fixture.departments)
+    _expect(client.get('/departments/%d/edit' % department_id), 200)
+
+
+def confirm_delete(client, fixture):
+    department_id, _ = fixture.rng.choice(fixture.departments)
+    _expect(client.get('/departments/%d/delete/confirm' % department_id), 200)
+
+
+SCENARIOS = [note_index, note_update, log_in, users_dashboard, user_update, department_update, confirm_delete]
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * p / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def measure(scenario, client, fixture, iterations, warmup):
+    for _ in range(warmup):
+        scenario(client, fixture)
+    timings = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        t = time.perf_counter()
+        scenario(client, fixture)
+        timings.append((time.perf_counter() - t) * 1000)
+    elapsed = time.perf_counter() - started
+    timings.sort()
+    return {
+        'iterations': iterations,
+        'mean_ms': sum(timings) / len(timings),
+        'p50_ms': percentile(timings, 50),
+        'p90_ms': percentile(timings, 90),
+        'p99_ms': percentile(timings, 99),
+        'max_ms': timings[-1],
+        'throughput_rps': iterations / elapsed,
+    }
+
+
+def run(scale='1k', database_url=None, iterations=200, warmup=20, only=None, fresh=False, seed=0, log=print):
+    """Seed ``scale`` (a key of seed.SCALES) and time every scenario.
+    Returns the JSON-serialisable result document."""
+    notes = seeding.SCALES[scale]
+    workdir = tempfile.mkdtemp(prefix='notes-bench-')
+    if database_url is None:
+        # One file per scale and seed, so a reused file always holds the
+        # data --seed asks for.
+        path = os.path.join(tempfile.gettempdir(), 'notes-bench-%s-%d.sqlite' % (scale, seed))
+        database_url = 'sqlite:///' + path
+
+    try:
+        app = build_app(database_url, workdir)
+        started = time.perf_counter()
+        if prepare(app, notes, fresh, seed):
+            log('seeded %d notes in %.1fs' % (notes, time.perf_counter() - started))
+
+        rng = random.Random(seed)
+        fixture = Fixture(app, rng)
+        client = app.test_client()
+        _expect(client.post('/log_in', data={'username': seeding.BENCH_USER,
+                                             'password': seeding.BENCH_PASSWORD}), 302)
+
+        results = {}
+        for scenario in SCENARIOS:
+            if only and scenario.__name__ not in only:
+                continue
+            results[scenario.__name__] = stats = measure(scenario, client, fixture, iterations, warmup)
+            log('%-18s p50 %8.2f ms  p90 %8.2f ms  p99 %8.2f ms  %8.1f req/s' % (
+                scenario.__name__, stats['p50_ms'], stats['p90_ms'], stats['p99_ms'], stats['throughput_rps']))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    with app.app_context():
+        dialect = db.engine.dialect.name
+    return {
+        'meta': {
+            'scale': scale,
+            'notes': notes,
+            'dialect': dialect,
+            'iterations': iterations,
+            'warmup': warmup,
+            'seed': seed,
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'flask': version('flask'),
+            'sqlalchemy': version('sqlalchemy'),
+            'created_at': datetime.datetime.utcnow().isoformat() + 'Z',
+        },
+        'results': results,
+    }
+
+
+def compare(baseline, current, threshold=0.1, metric='p50_ms'):
+    """Compare two run() documents scenario by scenario. Returns all rows as
+    ``(name, before, after, change)`` and the rows whose ``metric`` grew by
+    more than ``threshold`` (a ratio)."""
+    rows = []
+    for name, stats in current['results'].items():
+        before = baseline['results'].get(name)
+        if not before or not before.get(metric):
+            continue
+        change = stats[metric] / before[metric] - 1
+        rows.append((name, before[metric], stats[metric], change))
+    return rows, [row for row in rows if row[3] > threshold]
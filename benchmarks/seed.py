@@ -0,0 +1,81 @@
+import datetime
+import random
+
+from sqlalchemy import func, insert, inspect
+
+from ..models import (db, User, Note, Role, UserRoles, Department, UserDepartments,
+                      hash_body, render_markdown, renderer_version)
+
+SCALES = {'1k': 1000, '100k': 100000, '1m': 1000000}
+
+BENCH_USER = 'bench'
+BENCH_PASSWORD = 'bench-password'
+NOTES_PER_USER = 100
+ROLES = 10
+DEPARTMENTS = 20
+BATCH_SIZE = 10000
+
+BODIES = [
+    'Short note.',
+    '# Heading\n\nSome *emphasis*, a [link](https://example.com) and a list:\n\n- one\n- two\n- three\n',
+    'Code:\n\n```python\ndef add(a, b):\n    return a + b\n```\n\nAnd some text after it.\n',
+    '\n\n'.join('Paragraph %d with enough words to look like a real note body.' % i for i in range(20)),
+]
+
+
+def _batches(rows):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _insert(model, rows):
+    for batch in _batches(rows):
+        db.session.execute(insert(model), batch)
+        db.session.commit()
+
+
+def is_seeded(notes):
+    if not inspect(db.engine).has_table(Note.__tablename__):
+        return False
+    bench = User.query.filter_by(username=BENCH_USER).first()
+    return bench is not None and db.session.query(func.count(Note.id)).scalar() == notes
+
+
+def seed(notes, password_hash, seed=0):
+    """Fill an empty database with ``notes`` notes spread over one user per
+    NOTES_PER_USER notes, plus roles and departments with one of each per
+    user. The first user is BENCH_USER, an admin. Deterministic for a given
+    ``seed``."""
+    rng = random.Random(seed)
+    users = max(2, notes // NOTES_PER_USER)
+    now = datetime.datetime.utcnow().replace(microsecond=0)
+
+    _insert(Role, [{'id': 1, 'name': 'Admin'}] +
+            [{'id': i, 'name': 'role-%d' % i} for i in range(2, ROLES + 1)])
+    _insert(Department, ({'id': i, 'title': 'department-%d' % i} for i in range(1, DEPARTMENTS + 1)))
+    _insert(User, ({'id': i, 'username': BENCH_USER if i == 1 else 'user-%d' % i,
+                    'password': password_hash} for i in range(1, users + 1)))
+    _insert(UserRoles, ({'user_id': i, 'role_id': 1 if i == 1 else rng.randint(2, ROLES)}
+                        for i in range(1, users + 1)))
+    _insert(UserDepartments, ({'user_id': i, 'department_id': rng.randint(1, DEPARTMENTS)}
+                              for i in range(1, users + 1)))
+
+    rendered = [(body, render_markdown(body), hash_body(body)) for body in BODIES]
+    version = renderer_version()
+
+    def note_rows():
+        for i in range(notes):
+            body, html, body_hash = rendered[rng.randrange(len(rendered))]
+            stamp = now - datetime.timedelta(seconds=notes - i)
+            yield {'user_id': i % users + 1, 'title': 'Note %d' % i, 'body': body,
+                   'body_rendered': html, 'body_hash': body_hash, 'body_renderer': version,
+                   'created_at': stamp, 'updated_at': stamp}
+
+    _insert(Note, note_rows())
+    return users
@@ -0,0 +1,36 @@
+from collections import namedtuple
+
+from flask import abort, url_for
+
+from .models import Role, Department
+
+Deletable = namedtuple('Deletable', 'model noun label dashboard delete_endpoint id_arg')
+
+# URL segment -> what the confirm and delete views for it act on. The
+# segments match memberships.MEMBERSHIPS, so member_ids(kind, ...) applies.
+DELETABLES = {
+    'roles': Deletable(Role, 'role', 'name', 'roles_dashboard', 'role_delete', 'role_id'),
+    'departments': Deletable(Department, 'department', 'title', 'departments_dashboard',
+                             'department_delete', 'department_id'),
+}
+
+
+def resolve(kind, object_id):
+    """``(deletable, object)`` for a URL segment and id, loaded with a single
+    primary-key query. Aborts with 404 for unknown segments and ids."""
+    deletable = DELETABLES.get(kind)
+    if deletable is None:
+        abort(404)
+    try:
+        object_id = int(object_id)
+    except ValueError:
+        abort(404)
+    return deletable, deletable.model.query.filter_by(id=object_id).first_or_404()
+
+
+def label(deletable, obj):
+    return getattr(obj, deletable.label)
+
+
+def delete_url(deletable, obj):
+    return url_for(deletable.delete_endpoint, **{deletable.id_arg: obj.id})
@@ -0,0 +1,77 @@
+import io
+import json
+import re
+import zipfile
+
+EXPORT_BATCH_SIZE = 500
+
+
+def note_record(note, with_author=False):
+    record = {
+        'id': note.id,
+        'title': note.title,
+        'body': note.body,
+        'created_at': note.created_at.isoformat() if note.created_at else None,
+        'updated_at': note.updated_at.isoformat() if note.updated_at else None,
+    }
+    if with_author:
+        record['user_id'] = note.user_id
+    return record
+
+
+def export_ndjson(query, with_author=False, batch_size=EXPORT_BATCH_SIZE):
+    """Yield one JSON line per note. ``query`` is read through a server-side
+    cursor in batches, so memory stays flat whatever the number of notes."""
+    for note in query.yield_per(batch_size):
+        yield json.dumps(note_record(note, with_author)) + '\n'
+
+
+def note_markdown(note):
+    # Front matter values are JSON strings, which are also valid YAML.
+    lines = ['---', 'title: %s' % json.dumps(note.title or '')]
+    for field in ('created_at', 'updated_at'):
+        value = getattr(note, field)
+        lines.append('%s: %s' % (field, value.isoformat() if value else ''))
+    lines.extend(['---', ''])
+    return '\n'.join(lines) + (note.body or '')
+
+
+def note_filename(note, with_author=False):
+    slug = re.sub(r'[^a-z0-9]+', '-', (note.title or '').lower()).strip('-')[:60] or 'note'
+    name = '%d-%s.md' % (note.id, slug)
+    if with_author:
+        name = 'user-%d/%s' % (note.user_id, name)
+    return name
+
+
+class _Chunks(io.RawIOBase):
+    """Write-only sink zipfile can stream into; drained after every entry."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def export_zip(query, with_author=False, batch_size=EXPORT_BATCH_SIZE):
+    """Yield a ZIP archive with one Markdown file per note, entry by entry."""
+    sink = _Chunks()
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for note in query.yield_per(batch_size):
+            info = zipfile.ZipInfo(note_filename(note, with_author))
+            if note.updated_at:
+                info.date_time = note.updated_at.timetuple()[:6]
+            info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info, note_markdown(note))
+            yield sink.drain()
+    yield sink.drain()
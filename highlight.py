@@ -0,0 +1,41 @@
+import mistune
+
+try:
+    import pygments
+    from pygments import highlight
+    from pygments.formatters import HtmlFormatter
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+except ImportError:
+    pygments = None
+
+# Part of models.renderer_version(), so installing, upgrading or removing
+# Pygments re-renders cached notes.
+HIGHLIGHTER = 'pygments%s' % pygments.__version__ if pygments else None
+
+CSS_CLASS = 'highlight'
+
+
+class HighlightRenderer(mistune.HTMLRenderer):
+    """HTML renderer that highlights fenced code blocks with Pygments when it
+    is installed. Blocks without a known language are left as plain
+    ``<pre><code>``."""
+
+    def __init__(self, escape=True):
+        super().__init__(escape=escape)
+        if pygments:
+            self.formatter = HtmlFormatter(cssclass=CSS_CLASS)
+
+    def block_code(self, code, info=None):
+        lang = info.strip().split(None, 1)[0] if info and info.strip() else None
+        if pygments is None or not lang:
+            return super().block_code(code, info)
+        try:
+            lexer = get_lexer_by_name(lang)
+        except ClassNotFound:
+            return super().block_code(code, info)
+        return highlight(code, lexer, self.formatter)
+
+
+markdown = mistune.create_markdown(renderer=HighlightRenderer())
+
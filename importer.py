@@ -0,0 +1,162 @@
+import datetime
+import json
+import os
+import time
+import zipfile
+
+from sqlalchemy import insert
+
+from .models import db, Note, hash_body, render_markdown, renderer_version
+
+IMPORT_BATCH_SIZE = 500
+
+
+class NoteImportError(Exception):
+    """Raised when an import stops part way. ``committed`` records how many
+    source records are safely stored, i.e. where a retry should resume."""
+
+    def __init__(self, message, committed):
+        super().__init__(message)
+        self.committed = committed
+
+
+def _timestamp(value):
+    if not value:
+        return None
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def read_ndjson(stream):
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line.decode('utf-8') if isinstance(line, bytes) else line)
+        except ValueError:
+            raise ValueError('line %d is not valid JSON' % number)
+        if not isinstance(record, dict):
+            raise ValueError('line %d is not a JSON object' % number)
+        yield record
+
+
+def parse_markdown(text, filename):
+    """Split the front matter written by export.note_markdown from the body."""
+    record = {}
+    if text.startswith('---\n'):
+        header, sep, body = text[4:].partition('\n---\n')
+        if sep:
+            for line in header.splitlines():
+                key, _, value = line.partition(':')
+                value = value.strip()
+                if key.strip() == 'title' and value.startswith('"'):
+                    try:
+                        value = json.loads(value)
+                    except ValueError:
+                        pass
+                record[key.strip()] = value
+            text = body
+    if not record.get('title'):
+        stem = os.path.splitext(os.path.basename(filename))[0]
+        record['title'] = stem.split('-', 1)[-1] if stem.split('-', 1)[0].isdigit() else stem
+    record['body'] = text
+    return record
+
+
+def read_markdown_zip(stream):
+    with zipfile.ZipFile(stream) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or not info.filename.lower().endswith('.md'):
+                continue
+            text = archive.read(info).decode('utf-8')
+            yield parse_markdown(text, info.filename)
+
+
+def read_notes(stream):
+    """Yield note records from an NDJSON or ZIP-of-Markdown ``stream``,
+    one at a time. ZIP archives need a seekable stream."""
+    try:
+        is_zip = zipfile.is_zipfile(stream)
+        stream.seek(0)
+    except (AttributeError, OSError):
+        is_zip = False
+    if is_zip:
+        return read_markdown_zip(stream)
+    return read_ndjson(stream)
+
+
+def note_row(record, user_id, now):
+    body = record.get('body') or ''
+    return {
+        'user_id': user_id,
+        'title': (record.get('title') or 'Untitled')[:200],
+        'body': body,
+        'body_rendered': render_markdown(body),
+        'body_hash': hash_body(body),
+        'body_renderer': renderer_version(),
+        'created_at': _timestamp(record.get('created_at')) or now,
+        'updated_at': _timestamp(record.get('updated_at')) or now,
+    }
+
+
+class ImportResult(object):
+    def __init__(self):
+        self.imported = 0
+        self.batches = 0
+        self.skipped = 0
+        self.started = time.perf_counter()
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self):
+        return self.imported / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        return '%d notes in %d batches, %.1fs (%.0f notes/s)' % (
+            self.imported, self.batches, self.elapsed, self.rate)
+
+
+def import_notes(records, user_id, batch_size=IMPORT_BATCH_SIZE, skip=0, on_batch=None):
+    """Insert ``records`` as notes owned by ``user_id``, ``batch_size`` rows
+    per INSERT with one commit per batch. The first ``skip`` records are
+    passed over, which is how an interrupted import resumes.
+    ``on_batch(result, committed)`` runs after each commit, ``committed``
+    being the number of source records now stored."""
+    result = ImportResult()
+    committed = skip
+    consumed = skip
+    batch = []
+
+    def flush():
+        db.session.execute(insert(Note), batch)
+        db.session.commit()
+        result.imported += len(batch)
+        result.batches += 1
+        del batch[:]
+
+    try:
+        for position, record in enumerate(records):
+            if position < skip:
+                result.skipped += 1
+                continue
+            batch.append(note_row(record, user_id, datetime.datetime.utcnow()))
+            if len(batch) >= batch_size:
+                flush()
+                committed = position + 1
+                if on_batch:
+                    on_batch(result, committed)
+            consumed = position + 1
+        if batch:
+            flush()
+            committed = consumed
+            if on_batch:
+                on_batch(result, committed)
+    except Exception as e:
+        db.session.rollback()
+        raise NoteImportError(str(e), committed)
+    return result
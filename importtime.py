@@ -0,0 +1,43 @@
+import json
+import os
+import subprocess
+import sys
+
+SCRIPT = 'import importlib, json, sys; importlib.import_module(sys.argv[1]).create_app(json.loads(sys.argv[2]))'
+
+# Enough for create_app to run without an instance config or a database.
+TEST_CONFIG = {
+    'SQLALCHEMY_DATABASE_URI': 'sqlite://',
+    'USER_ENABLE_EMAIL': False,
+    'ASSETS_FINGERPRINT': False,
+    'TEMPLATE_CACHE_DIR': None,
+}
+
+
+def _importtime(args):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+    proc = subprocess.run([sys.executable, '-X', 'importtime'] + args,
+                          capture_output=True, text=True, env=env, check=True)
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Only top-level imports: their cumulative time includes the rest.
+        if not cumulative.strip().isdigit() or name[1:2] == ' ':
+            continue
+        modules[name.strip()] = int(cumulative) / 1000.0
+    return modules
+
+
+def measure(import_name, test_config=None):
+    """Milliseconds spent importing modules while a fresh interpreter imports
+    ``import_name`` and runs its create_app(), as reported by
+    ``python -X importtime``. Returns ``(total, [(module, ms), ...])`` with
+    the slowest top-level imports first; interpreter start-up is excluded."""
+    baseline = _importtime(['-c', 'pass'])
+    config = json.dumps(test_config or TEST_CONFIG)
+    modules = _importtime(['-c', SCRIPT, import_name, config])
+    top = sorted(((name, ms) for name, ms in modules.items() if name not in baseline),
+                 key=lambda item: item[1], reverse=True)
+    return sum(ms for _, ms in top), top
@@ -0,0 +1,153 @@
+import json
+import re
+import time
+from collections import Counter
+
+from flask import g, has_app_context, request
+from flask.signals import before_render_template, request_started, template_rendered
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# "IN (?, ?, ?)" and "IN (%(id_1)s, %(id_2)s)" have the same shape whatever
+# the number of values.
+_PARAM_LISTS = re.compile(r'\((?:\?|%\(\w+\)s)(?:,\s*(?:\?|%\(\w+\)s))*\)')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def statement_shape(statement):
+    return _PARAM_LISTS.sub('(?)', _WHITESPACE.sub(' ', statement).strip())
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised in strict mode when a request runs more statements than its
+    query budget allows."""
+
+
+class RequestStats(object):
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+        self.shapes = Counter()
+        self._query_started = []
+        self._render_started = []
+
+    def repeated(self, threshold):
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+
+def _stats():
+    return g.get('_request_stats') if has_app_context() else None
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _stats()
+    if stats is not None:
+        stats._query_started.append(time.perf_counter())
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _stats()
+    if stats is not None and stats._query_started:
+        stats.db_time += time.perf_counter() - stats._query_started.pop()
+        stats.queries += 1
+        stats.shapes[statement_shape(statement)] += 1
+
+
+class Instrumentation(object):
+    """Counts SQL statements and splits each request's time into database,
+    template and Python time.
+
+    Results go out as a ``Server-Timing`` header when SERVER_TIMING is set
+    (the default under DEBUG only, as it tells anyone how long the database
+    took) and as one JSON log line per request on the ``<app>.requests``
+    logger. A statement shape that runs NPLUSONE_THRESHOLD or more times in
+    one request is logged as a likely N+1. QUERY_BUDGET caps statements per request, overridden
+    per endpoint by QUERY_BUDGETS; going over it is logged, or raises
+    QueryBudgetExceeded when QUERY_BUDGET_STRICT is set (the default under
+    TESTING).
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('INSTRUMENTATION_ENABLED', True)
+        app.config.setdefault('SERVER_TIMING', app.debug)
+        app.config.setdefault('NPLUSONE_THRESHOLD', 5)
+        app.config.setdefault('QUERY_BUDGET', None)
+        app.config.setdefault('QUERY_BUDGETS', {})
+        app.config.setdefault('QUERY_BUDGET_STRICT', app.testing)
+        self.app = app
+        self.logger = app.logger.getChild('requests')
+        app.extensions['instrumentation'] = self
+        if not app.config['INSTRUMENTATION_ENABLED']:
+            return
+        request_started.connect(self._request_started, app)
+        before_render_template.connect(self._before_render, app)
+        template_rendered.connect(self._after_render, app)
+        # after_request hooks run in reverse order: this one runs last.
+        app.after_request_funcs.setdefault(None, []).insert(0, self._after_request)
+
+    def _request_started(self, sender, **extra):
+        g._request_stats = RequestStats()
+
+    def _before_render(self, sender, **extra):
+        stats = _stats()
+        if stats is not None:
+            stats._render_started.append((time.perf_counter(), stats.db_time))
+
+    def _after_render(self, sender, **extra):
+        stats = _stats()
+        if stats is not None and stats._render_started:
+            started, db_time = stats._render_started.pop()
+            # Lazy loads while rendering count as database time, not template.
+            stats.template_time += (time.perf_counter() - started) - (stats.db_time - db_time)
+
+    def budget(self, endpoint):
+        return self.app.config['QUERY_BUDGETS'].get(endpoint, self.app.config['QUERY_BUDGET'])
+
+    def _after_request(self, response):
+        stats = _stats()
+        if stats is None or request.endpoint == 'static':
+            return response
+        total = time.perf_counter() - stats.started
+        python_time = max(0.0, total - stats.db_time - stats.template_time)
+        repeated = stats.repeated(self.app.config['NPLUSONE_THRESHOLD'])
+        budget = self.budget(request.endpoint)
+
+        if self.app.config['SERVER_TIMING']:
+            response.headers.add('Server-Timing', ', '.join([
+                'db;dur=%.1f;desc="%d queries"' % (stats.db_time * 1000, stats.queries),
+                'tpl;dur=%.1f' % (stats.template_time * 1000),
+                'app;dur=%.1f' % (python_time * 1000),
+                'total;dur=%.1f' % (total * 1000),
+            ]))
+
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'endpoint': request.endpoint,
+            'status': response.status_code,
+            'queries': stats.queries,
+            'db_ms': round(stats.db_time * 1000, 2),
+            'template_ms': round(stats.template_time * 1000, 2),
+            'python_ms': round(python_time * 1000, 2),
+            'total_ms': round(total * 1000, 2),
+        }
+        if repeated:
+            record['repeated'] = [{'count': count, 'statement': shape} for shape, count in repeated]
+            self.logger.warning('Possible N+1 in %s: %d statements, %s', request.endpoint, stats.queries,
+                                '; '.join('%dx %s' % (count, shape[:200]) for shape, count in repeated))
+        self.logger.info(json.dumps(record))
+
+        if budget is not None and stats.queries > budget:
+            message = '%s ran %d queries, over its budget of %d' % (request.endpoint, stats.queries, budget)
+            if self.app.config['QUERY_BUDGET_STRICT']:
+                raise QueryBudgetExceeded(message)
+            self.logger.warning(message)
+        return response
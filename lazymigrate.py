@@ -0,0 +1,35 @@
+import click
+
+
+class LazyMigrate(object):
+    """Stands in for app.extensions['migrate'] so that Flask-Migrate, and
+    alembic with it, are only imported once a ``flask db`` command runs."""
+
+    def __init__(self, app, db):
+        self._app = app
+        self._db = db
+        app.extensions['migrate'] = self
+        app.cli.add_command(MigrateCommands('db', help='Perform database migrations.'))
+
+    def __getattr__(self, name):
+        from flask_migrate import Migrate
+        Migrate(self._app, self._db)
+        return getattr(self._app.extensions['migrate'], name)
+
+
+class MigrateCommands(click.Group):
+    """``flask db``: its subcommands are Flask-Migrate's, loaded when used."""
+
+    def _group(self):
+        from flask_migrate.cli import db
+        return db
+
+    def make_context(self, info_name, args, parent=None, **extra):
+        # Parse with the real group so its options (-d, -x) and callback apply.
+        return self._group().make_context(info_name, args, parent=parent, **extra)
+
+    def list_commands(self, ctx):
+        return self._group().list_commands(ctx)
+
+    def get_command(self, ctx, name):
+        return self._group().get_command(ctx, name)
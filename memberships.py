@@ -0,0 +1,121 @@
+from sqlalchemy import delete, select, true
+
+from .models import db, User, Role, Department, UserRoles, UserDepartments
+
+# URL segment -> (association model, its target column, target model)
+MEMBERSHIPS = {
+    'roles': (UserRoles, UserRoles.role_id, Role),
+    'departments': (UserDepartments, UserDepartments.department_id, Department),
+}
+
+# URL segment -> the column a role/department is shown and looked up by.
+LABELS = {
+    'roles': Role.name,
+    'departments': Department.title,
+}
+
+
+def _insert(model):
+    # Imported here: only the dialect in use should be loaded.
+    if db.engine.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(model)
+
+
+def add_members(kind, user_ids, target_ids):
+    """Attach every user in ``user_ids`` to every role/department in
+    ``target_ids`` with a single INSERT ... SELECT ... ON CONFLICT DO NOTHING.
+    Unknown ids and existing memberships are skipped. Returns the number of
+    rows inserted; the caller commits."""
+    association, column, target = MEMBERSHIPS[kind]
+    if not user_ids or not target_ids:
+        return 0
+    pairs = (select(User.id, target.id)
+             .select_from(User).join(target, true())
+             .where(User.id.in_(user_ids), target.id.in_(target_ids)))
+    statement = _insert(association).from_select(['user_id', column.key], pairs)
+    statement = statement.on_conflict_do_nothing(index_elements=['user_id', column.key])
+    return db.session.execute(statement).rowcount
+
+
+def remove_members(kind, user_ids, target_ids):
+    """Detach every user in ``user_ids`` from every role/department in
+    ``target_ids`` with a single DELETE. Returns the number of rows removed;
+    the caller commits."""
+    association, column, target = MEMBERSHIPS[kind]
+    if not user_ids or not target_ids:
+        return 0
+    statement = delete(association).where(
+        association.user_id.in_(user_ids), column.in_(target_ids))
+    return db.session.execute(statement).rowcount
+
+
+def members(kind, target_id):
+    """``(id, username)`` of the users in one role/department, by username,
+    joined straight through the association table."""
+    association, column, target = MEMBERSHIPS[kind]
+    return (db.session.query(User.id, User.username)
+            .join(association, association.user_id == User.id)
+            .filter(column == target_id)
+            .order_by(User.username)
+            .all())
+
+
+def search_users(prefix, limit=10, not_in=None):
+    """``(id, username)`` of up to ``limit`` users whose name starts with
+    ``prefix``, by username. ``not_in=(kind, target_id)`` leaves out the
+    members of that role/department."""
+    query = db.session.query(User.id, User.username)
+    if db.engine.dialect.name == 'postgresql':
+        # Served by ix_user_username_pattern (varchar_pattern_ops).
+        query = query.filter(User.username.startswith(prefix, autoescape=True))
+    else:
+        # SQLite's LIKE is case-insensitive and can't use the username index;
+        # the equivalent range can.
+        query = query.filter(User.username >= prefix, User.username < prefix + '\U0010ffff')
+    if not_in is not None:
+        kind, target_id = not_in
+        association, column, target = MEMBERSHIPS[kind]
+        query = query.filter(~select(association.id).where(
+            association.user_id == User.id, column == target_id).exists())
+    return query.order_by(User.username).limit(limit).all()
+
+
+def member_ids(kind, target_id):
+    """Ids of the users in one role/department."""
+    association, column, target = MEMBERSHIPS[kind]
+    return [user_id for user_id, in db.session.query(association.user_id).filter(column == target_id)]
+
+
+def _is_member(kind, user_id):
+    association, column, target = MEMBERSHIPS[kind]
+    return select(association.id).where(association.user_id == user_id, column == target.id).exists()
+
+
+def assigned(kind, user_id):
+    """``(id, label)`` rows for the roles/departments ``user_id`` belongs to."""
+    target = MEMBERSHIPS[kind][2]
+    label = LABELS[kind]
+    return (db.session.query(target.id, label.label('label'))
+            .filter(_is_member(kind, user_id)).order_by(label).all())
+
+
+def available(kind, user_id):
+    """``(id, label)`` rows for the roles/departments ``user_id`` could join,
+    found with an anti-join rather than by diffing ORM collections."""
+    target = MEMBERSHIPS[kind][2]
+    label = LABELS[kind]
+    return (db.session.query(target.id, label.label('label'))
+            .filter(~_is_member(kind, user_id)).order_by(label).all())
+
+
+def ids_for_labels(kind, labels):
+    """Ids of the roles/departments named in ``labels``; unknown ones are
+    skipped."""
+    labels = [label for label in labels if label]
+    if not labels:
+        return []
+    target = MEMBERSHIPS[kind][2]
+    return [target_id for target_id, in db.session.query(target.id).filter(LABELS[kind].in_(labels))]
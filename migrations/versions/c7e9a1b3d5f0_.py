@@ -0,0 +1,53 @@
+"""full-text search over notes
+
+Revision ID: c7e9a1b3d5f0
+Revises: b4d6f8a0c2e1
+Create Date: 2026-10-18 13:40:02.771530
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7e9a1b3d5f0'
+down_revision = 'b4d6f8a0c2e1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "ALTER TABLE note ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(body, '')), 'B')) STORED"
+        )
+        op.create_index('ix_note_search_vector', 'note', ['search_vector'], postgresql_using='gin')
+    else:
+        op.execute("CREATE VIRTUAL TABLE note_fts USING fts5(title, body, content='note', content_rowid='id')")
+        op.execute(
+            "CREATE TRIGGER note_fts_ai AFTER INSERT ON note BEGIN "
+            "INSERT INTO note_fts(rowid, title, body) VALUES (new.id, new.title, new.body); END"
+        )
+        op.execute(
+            "CREATE TRIGGER note_fts_ad AFTER DELETE ON note BEGIN "
+            "INSERT INTO note_fts(note_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body); END"
+        )
+        op.execute(
+            "CREATE TRIGGER note_fts_au AFTER UPDATE OF title, body ON note BEGIN "
+            "INSERT INTO note_fts(note_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body); "
+            "INSERT INTO note_fts(rowid, title, body) VALUES (new.id, new.title, new.body); END"
+        )
+        op.execute("INSERT INTO note_fts(note_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_note_search_vector', table_name='note')
+        op.drop_column('note', 'search_vector')
+    else:
+        op.execute("DROP TRIGGER note_fts_au")
+        op.execute("DROP TRIGGER note_fts_ad")
+        op.execute("DROP TRIGGER note_fts_ai")
+        op.execute("DROP TABLE note_fts")
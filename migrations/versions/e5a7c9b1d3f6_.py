@@ -0,0 +1,29 @@
+"""prefix-search index on user.username
+
+Revision ID: e5a7c9b1d3f6
+Revises: d2f4b6c8e0a3
+Create Date: 2026-10-18 19:04:37.512834
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a7c9b1d3f6'
+down_revision = 'd2f4b6c8e0a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # SQLite range-scans the existing unique index; only Postgres needs one
+    # that LIKE 'prefix%' can use under a non-C collation.
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_index('ix_user_username_pattern', 'user', ['username'],
+                        postgresql_ops={'username': 'varchar_pattern_ops'})
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_user_username_pattern', table_name='user')
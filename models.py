@@ -1,10 +1,52 @@
+import functools
+import hashlib
 from flask_sqlalchemy import SQLAlchemy 
-from mistune import markdown
+from sqlalchemy.dialects import sqlite
 
-db = SQLAlchemy()
+from .replicas import RoutingSession
+
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+
+# Bump when the markdown output changes for the same input (renderer options,
+# plugins, ...) so cached HTML gets re-rendered.
+RENDERER_REVISION = 2
+
+@functools.lru_cache(maxsize=None)
+def renderer_version():
+    # mistune and Pygments are imported here, on first use, rather than by
+    # every process that imports the models.
+    from .highlight import HIGHLIGHTER, mistune
+    version = 'mistune-%s.%d' % (mistune.__version__, RENDERER_REVISION)
+    return version + '+' + HIGHLIGHTER if HIGHLIGHTER else version
+
+def render_markdown(text):
+    from .highlight import markdown
+    return markdown(text)
+
+EXCERPT_LENGTH = 280
+
+# SQLite stores now() as 'YYYY-MM-DD HH:MM:SS'; bind datetimes the same way so
+# comparisons against server-generated timestamps (keyset cursors) line up.
+Timestamp = db.DateTime().with_variant(sqlite.DATETIME(
+    storage_format='%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d'), 'sqlite')
+
+def note_etag(note_id, version):
+    # Keyed on the version counter: updated_at only has second resolution on
+    # SQLite, so two writes in the same second would share a strong ETag.
+    key = '%s:%s' % (note_id, version)
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+def hash_body(body):
+    key = '%s:%s' % (renderer_version(), body or '')
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
 
 class User(db.Model):
     __tablename__ = 'user'
+    __table_args__ = (
+        # Lets LIKE 'prefix%' use an index whatever the database collation.
+        db.Index('ix_user_username_pattern', 'username',
+                 postgresql_ops={'username': 'varchar_pattern_ops'}).ddl_if(dialect='postgresql'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
     password = db.Column(db.String(200))
@@ -14,17 +56,62 @@ class User(db.Model):
     roles = db.relationship('Role', secondary='user_roles', backref='author', lazy=True)
     departments = db.relationship('Department', secondary='user_departments', backref='author', lazy=True)
 
+    @property
+    def is_admin(self):
+        # Worked out once per loaded instance; load_user eager-loads roles so
+        # this never costs a query of its own.
+        if '_is_admin' not in self.__dict__:
+            self._is_admin = any('Admin' in role.name for role in self.roles)
+        return self._is_admin
+
 class Note(db.Model):
+    __table_args__ = (
+        db.Index('ix_note_user_id_updated_at', 'user_id', 'updated_at'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200))
     body = db.Column(db.Text)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
-    updated_at = db.Column(db.DateTime, server_default=db.func.now(), server_onupdate=db.func.now())
+    updated_at = db.Column(Timestamp, server_default=db.func.now(), onupdate=db.func.now())
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    body_rendered = db.Column(db.Text)
+    body_hash = db.Column(db.String(64))
+    body_renderer = db.Column(db.String(32))
+    version = db.Column(db.Integer, nullable=False, server_default='1')
+    # Cut in SQL, so the notes list never loads whole bodies.
+    excerpt = db.column_property(db.func.substr(body, 1, EXCERPT_LENGTH), deferred=True)
+
+    __mapper_args__ = {'version_id_col': version}
+
+    def render(self):
+        key = hash_body(self.body)
+        if self.body_hash != key or self.body_renderer != renderer_version():
+            self.body_rendered = render_markdown(self.body or '')
+            self.body_hash = key
+            self.body_renderer = renderer_version()
+        return self.body_rendered
+
+    @property
+    def etag(self):
+        return note_etag(self.id, self.version)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'title': self.title,
+            'body': self.body,
+            'body_html': self.body_html,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+        }
 
     @property
     def body_html(self):
-        return markdown(self.body)
+        # Every write goes through render(), so a cache produced by the current
+        # renderer is trusted without touching (possibly deferred) body.
+        if self.body_rendered is not None and self.body_renderer == renderer_version():
+            return self.body_rendered
+        return self.render()
 
 class Role(db.Model):
     __tablename__ = 'roles'
@@ -35,6 +122,10 @@ class Role(db.Model):
 
 class UserRoles(db.Model):
     __tablename__ = 'user_roles'
+    __table_args__ = (
+        db.Index('ix_user_roles_user_id_role_id', 'user_id', 'role_id', unique=True),
+        db.Index('ix_user_roles_role_id', 'role_id'),
+    )
     id = db.Column(db.Integer(), primary_key=True)
     user_id = db.Column(db.Integer(), db.ForeignKey('user.id', ondelete='CASCADE'))
     role_id = db.Column(db.Integer(), db.ForeignKey('roles.id', ondelete='CASCADE'))
@@ -48,10 +139,32 @@ class Department(db.Model):
 
     @property
     def body_html(self):
-        return markdown(self.body)
+        return render_markdown(self.body)
 
 class UserDepartments(db.Model):
     __tablename__ = 'user_departments'
+    __table_args__ = (
+        db.Index('ix_user_departments_user_id_department_id', 'user_id', 'department_id', unique=True),
+        db.Index('ix_user_departments_department_id', 'department_id'),
+    )
     id = db.Column(db.Integer(), primary_key=True)
     user_id = db.Column(db.Integer(), db.ForeignKey('user.id', ondelete='CASCADE'))
     department_id = db.Column(db.Integer(), db.ForeignKey('department.id', ondelete='CASCADE'))
+
+
+def unindexed_foreign_keys(metadata=None):
+    """Return ``(table, columns)`` for every foreign key whose columns are not
+    the leading columns of an index, unique constraint or primary key."""
+    metadata = metadata or db.metadata
+    missing = []
+    for table in metadata.sorted_tables:
+        covered = [table.primary_key.columns.keys()]
+        covered += [[c.name for c in index.columns] for index in table.indexes]
+        covered += [constraint.columns.keys() for constraint in table.constraints
+                    if isinstance(constraint, db.UniqueConstraint)]
+        covered += [[column.name] for column in table.columns if column.index or column.unique]
+        for fk in table.foreign_key_constraints:
+            columns = fk.columns.keys()
+            if not any(c[:len(columns)] == columns for c in covered):
+                missing.append((table.name, columns))
+    return missing
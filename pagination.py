@@ -0,0 +1,98 @@
+import base64
+import datetime
+import json
+
+from sqlalchemy import DateTime, and_, or_
+
+
+def encode_cursor(values):
+    values = [v.isoformat() if isinstance(v, datetime.datetime) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(values).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor, columns):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(values, list) or len(values) != len(columns):
+        return None
+    decoded = []
+    for column, value in zip(columns, values):
+        if isinstance(column.type, DateTime):
+            try:
+                value = datetime.datetime.fromisoformat(value)
+            except (ValueError, TypeError):
+                return None
+        decoded.append(value)
+    return decoded
+
+
+def _after(columns, values, descending):
+    # Row-value comparison spelled out so it works on every backend:
+    # (a, b) < (x, y)  <=>  a < x OR (a = x AND b < y)
+    clauses = []
+    for i, column in enumerate(columns):
+        equal = [c == v for c, v in zip(columns[:i], values[:i])]
+        compare = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*equal, compare))
+    return or_(*clauses)
+
+
+class KeysetPage(object):
+    def __init__(self, items, columns, has_next, has_prev):
+        self.items = items
+        self.has_next = has_next
+        self.has_prev = has_prev
+        self._columns = columns
+
+    def _cursor(self, item):
+        return encode_cursor([getattr(item, c.key) for c in self._columns])
+
+    @property
+    def next_cursor(self):
+        if self.has_next and self.items:
+            return self._cursor(self.items[-1])
+
+    @property
+    def prev_cursor(self):
+        if self.has_prev and self.items:
+            return self._cursor(self.items[0])
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+def keyset_page(query, columns, per_page, after=None, before=None):
+    """Return one page of ``query`` ordered by ``columns`` descending.
+
+    ``after``/``before`` are cursors taken from a previous page's
+    ``next_cursor``/``prev_cursor``. Only ``per_page + 1`` rows are read,
+    whatever the offset into the result set.
+    """
+    backwards = False
+    if after:
+        values = decode_cursor(after, columns)
+        if values is not None:
+            query = query.filter(_after(columns, values, descending=True))
+    elif before:
+        values = decode_cursor(before, columns)
+        if values is not None:
+            query = query.filter(_after(columns, values, descending=False))
+            backwards = True
+
+    if backwards:
+        query = query.order_by(*[c.asc() for c in columns])
+    else:
+        query = query.order_by(*[c.desc() for c in columns])
+    items = query.limit(per_page + 1).all()
+    more = len(items) > per_page
+    items = items[:per_page]
+
+    if backwards:
+        items.reverse()
+        return KeysetPage(items, columns, has_next=True, has_prev=more)
+    return KeysetPage(items, columns, has_next=more, has_prev=bool(after))
@@ -0,0 +1,131 @@
+import os
+import threading
+import time
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class HasherBusy(Exception):
+    """Raised when PASSWORD_HASH_MAX_PENDING hashes are already queued, a
+    hash takes longer than PASSWORD_HASH_TIMEOUT or the pool broke under it."""
+
+
+class PasswordHasher(object):
+    """Runs password hashing in a bounded process pool so CPU-heavy hashes
+    don't hold the GIL of the request worker or starve other routes.
+
+    PASSWORD_HASH_METHOD is any werkzeug method string including its cost,
+    e.g. ``pbkdf2:sha256:600000`` or ``scrypt:32768:8:1``. Hashes made with
+    anything else are reported by ``needs_rehash``. PASSWORD_HASH_WORKERS=0
+    hashes inline on the request thread.
+    """
+
+    def __init__(self, app=None):
+        self._pool = None
+        self._pool_pid = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._stats = {'count': 0, 'total': 0.0, 'max': 0.0, 'max_queue_depth': 0, 'rejected': 0,
+                       'timed_out': 0, 'pool_restarts': 0}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('PASSWORD_HASH_METHOD', 'pbkdf2:sha256:600000')
+        app.config.setdefault('PASSWORD_HASH_WORKERS', os.cpu_count() or 1)
+        app.config.setdefault('PASSWORD_HASH_MAX_PENDING', 64)
+        app.config.setdefault('PASSWORD_HASH_TIMEOUT', 30)
+        self.method = app.config['PASSWORD_HASH_METHOD']
+        self.workers = app.config['PASSWORD_HASH_WORKERS']
+        self.max_pending = app.config['PASSWORD_HASH_MAX_PENDING']
+        self.timeout = app.config['PASSWORD_HASH_TIMEOUT']
+        app.extensions['password_hasher'] = self
+
+    def _executor(self):
+        # Pools don't survive fork, so each worker process makes its own.
+        with self._lock:
+            if self._pool is None or self._pool_pid != os.getpid():
+                from concurrent.futures import ProcessPoolExecutor
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+                self._pool_pid = os.getpid()
+            return self._pool
+
+    def _discard(self, pool):
+        # A pool whose worker died refuses all further work; the next
+        # _executor() call starts a fresh one.
+        with self._lock:
+            if self._pool is not pool:
+                return
+            self._pool = None
+            self._stats['pool_restarts'] += 1
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, fn, *args):
+        from concurrent.futures.process import BrokenProcessPool
+        pool = self._executor()
+        try:
+            return pool, pool.submit(fn, *args)
+        except BrokenProcessPool:
+            self._discard(pool)
+            pool = self._executor()
+            return pool, pool.submit(fn, *args)
+
+    def _finished(self, started):
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._pending -= 1
+            self._stats['count'] += 1
+            self._stats['total'] += elapsed
+            self._stats['max'] = max(self._stats['max'], elapsed)
+
+    def _run(self, fn, *args):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._stats['rejected'] += 1
+                raise HasherBusy()
+            self._pending += 1
+            self._stats['max_queue_depth'] = max(self._stats['max_queue_depth'], self._pending)
+        started = time.perf_counter()
+        if not self.workers:
+            try:
+                return fn(*args)
+            finally:
+                self._finished(started)
+
+        from concurrent.futures import TimeoutError
+        from concurrent.futures.process import BrokenProcessPool
+        try:
+            pool, future = self._submit(fn, *args)
+        except BaseException:
+            self._finished(started)
+            raise
+        # The slot is freed when the hash is done, not when we stop waiting
+        # for it, so PASSWORD_HASH_MAX_PENDING bounds the pool's real backlog.
+        future.add_done_callback(lambda future: self._finished(started))
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            future.cancel()
+            with self._lock:
+                self._stats['timed_out'] += 1
+            raise HasherBusy()
+        except BrokenProcessPool:
+            self._discard(pool)
+            raise HasherBusy()
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def check(self, pwhash, password):
+        if not pwhash:
+            return False
+        return self._run(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash):
+        return pwhash.split('$', 1)[0] != self.method
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats, queue_depth=self._pending)
+        stats['mean'] = stats['total'] / stats['count'] if stats['count'] else 0.0
+        return stats
@@ -0,0 +1,191 @@
+import cProfile
+import json
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+
+from flask import g, request
+
+_NAME = re.compile(r'^[\w.-]+$')
+
+
+def collapse(frame):
+    """One stack in flamegraph "collapsed" form, root first."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append('%s (%s:%d)' % (code.co_name, os.path.basename(code.co_filename), code.co_firstlineno))
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+def format_collapsed(stacks):
+    return ''.join('%s %d\n' % (stack, count) for stack, count in sorted(stacks.items()))
+
+
+class Sampler(threading.Thread):
+    """Samples the stacks of one thread (``thread_id``) or of every other
+    thread in the process every ``interval`` seconds until stopped or until
+    ``duration`` has passed."""
+
+    def __init__(self, interval, thread_id=None, duration=None, on_finish=None):
+        super().__init__(name='profile-sampler', daemon=True)
+        self.interval = interval
+        self.thread_id = thread_id
+        self.deadline = time.monotonic() + duration if duration else None
+        self.on_finish = on_finish
+        self.stacks = Counter()
+        self.samples = 0
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            if self.deadline is not None and time.monotonic() >= self.deadline:
+                break
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == self.ident or (self.thread_id is not None and thread_id != self.thread_id):
+                    continue
+                self.stacks[collapse(frame)] += 1
+            self.samples += 1
+        if self.on_finish:
+            self.on_finish(self)
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+        return self.stacks
+
+
+class Profiler(object):
+    """Profiles single requests for admins, and every worker on request.
+
+    An admin adds ``?_profile=cprofile`` or ``?_profile=sample`` (or the
+    ``X-Profile`` header) to any URL. cProfile output is stored as a pstats
+    file, samples as a collapsed-stack file for flamegraph tools, both in
+    PROFILE_DIR; the ``X-Profile`` response header names the file.
+
+    sample_workers() asks every worker process sharing PROFILE_DIR to sample
+    itself for a while. Workers pick the request up at their next request.
+    """
+
+    control_file = 'sampling.json'
+
+    def __init__(self, app=None):
+        self._session = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('PROFILE_ENABLED', True)
+        app.config.setdefault('PROFILE_DIR', os.path.join(app.instance_path, 'profiles'))
+        app.config.setdefault('PROFILE_SAMPLE_INTERVAL', 0.005)
+        app.config.setdefault('PROFILE_MAX_SECONDS', 20)
+        self.directory = app.config['PROFILE_DIR']
+        self.interval = app.config['PROFILE_SAMPLE_INTERVAL']
+        self.max_seconds = app.config['PROFILE_MAX_SECONDS']
+        app.extensions['profiler'] = self
+        if not app.config['PROFILE_ENABLED']:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        # Needs g.user, so create the profiler after load_user is registered.
+        app.before_request(self._start)
+        app.after_request(self._finish)
+
+    def _start(self):
+        self._maybe_join_sampling()
+        mode = request.args.get('_profile') or request.headers.get('X-Profile')
+        if mode not in ('cprofile', 'sample') or not (g.get('user') and g.user.is_admin):
+            return
+        if mode == 'cprofile':
+            g.profile = cProfile.Profile()
+            g.profile.enable()
+        else:
+            g.profile = Sampler(self.interval, thread_id=threading.get_ident())
+            g.profile.start()
+
+    def _finish(self, response):
+        profile = g.pop('profile', None)
+        if profile is None:
+            return response
+        name = '%s-%s-%s' % (time.strftime('%Y%m%dT%H%M%S'), request.endpoint, uuid.uuid4().hex[:8])
+        if isinstance(profile, cProfile.Profile):
+            profile.disable()
+            name += '.prof'
+            profile.dump_stats(os.path.join(self.directory, name))
+        else:
+            name += '.collapsed'
+            with open(os.path.join(self.directory, name), 'w') as f:
+                f.write(format_collapsed(profile.stop()))
+        response.headers['X-Profile'] = name
+        return response
+
+    def path(self, name):
+        """Path of a stored profile, or None for names that aren't one."""
+        if not _NAME.match(name) or name == self.control_file:
+            return None
+        path = os.path.join(self.directory, name)
+        return path if os.path.isfile(path) else None
+
+    def list(self):
+        return sorted((name for name in os.listdir(self.directory)
+                       if name.endswith(('.prof', '.collapsed'))), reverse=True)
+
+    def sample_workers(self, seconds):
+        """Have every worker sample itself for ``seconds`` and return the
+        merged collapsed stacks and how many processes took part."""
+        seconds = min(seconds, self.max_seconds)
+        session = uuid.uuid4().hex[:12]
+        control = os.path.join(self.directory, self.control_file)
+        tmp = '%s.%d.tmp' % (control, os.getpid())
+        with open(tmp, 'w') as f:
+            json.dump({'session': session, 'until': time.time() + seconds}, f)
+        os.replace(tmp, control)
+        self._checked = 0.0
+        self._maybe_join_sampling()
+
+        # Give workers that finish just after us a moment to write.
+        time.sleep(seconds + 1)
+        stacks = Counter()
+        workers = 0
+        prefix = 'workers-%s-' % session
+        for name in os.listdir(self.directory):
+            if name.startswith(prefix) and name.endswith('.collapsed'):
+                workers += 1
+                with open(os.path.join(self.directory, name)) as f:
+                    for line in f:
+                        stack, _, count = line.rstrip('\n').rpartition(' ')
+                        stacks[stack] += int(count)
+        with open(os.path.join(self.directory, 'workers-%s.collapsed' % session), 'w') as f:
+            f.write(format_collapsed(stacks))
+        return stacks, workers
+
+    def _maybe_join_sampling(self):
+        # Checked at most once a second per process.
+        now = time.time()
+        if now - self._checked < 1.0:
+            return
+        self._checked = now
+        try:
+            with open(os.path.join(self.directory, self.control_file)) as f:
+                control = json.load(f)
+        except (OSError, ValueError):
+            return
+        if control['until'] <= now:
+            return
+        with self._lock:
+            if self._session == control['session']:
+                return
+            self._session = control['session']
+        path = os.path.join(self.directory, 'workers-%s-%d.collapsed' % (control['session'], os.getpid()))
+
+        def write(sampler):
+            with open(path, 'w') as f:
+                f.write(format_collapsed(sampler.stacks))
+
+        Sampler(self.interval, duration=control['until'] - now, on_finish=write).start()
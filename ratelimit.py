@@ -0,0 +1,137 @@
+import functools
+import threading
+import time
+
+from flask import request
+
+from .sqlitelocal import LocalConnections
+
+
+class MemoryStorage(object):
+    """Token buckets in a dict; only shared by the threads of one process."""
+
+    max_keys = 100000
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def take(self, key, capacity, rate, now):
+        with self._lock:
+            if len(self._buckets) >= self.max_keys:
+                self._prune(capacity, rate, now)
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+        return allowed, tokens
+
+    def _prune(self, capacity, rate, now):
+        # Buckets that have refilled completely carry no information.
+        self._buckets = {k: v for k, v in self._buckets.items()
+                         if v[0] + (now - v[1]) * rate < capacity}
+
+
+class SQLiteStorage(object):
+    """Token buckets in a local SQLite file, shared by every worker process
+    on the host. Each take() is one short write transaction."""
+
+    prune_every = 1000
+
+    def __init__(self, path):
+        self.path = path
+        self._connections = LocalConnections(path)
+        self._takes = 0
+        self._refill = 0.0
+        with self._connect() as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS buckets '
+                         '(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)')
+
+    def _connect(self):
+        return self._connections.get()
+
+    def take(self, key, capacity, rate, now):
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute('SELECT tokens, updated FROM buckets WHERE key = ?', (key,)).fetchone()
+            tokens, updated = row if row else (capacity, now)
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            conn.execute('INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)',
+                         (key, tokens, now))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        self._refill = max(self._refill, capacity / rate)
+        self._takes += 1
+        if self._takes % self.prune_every == 0:
+            self._prune(now)
+        return allowed, tokens
+
+    def _prune(self, now):
+        # A bucket untouched for the longest refill time seen is full again
+        # and carries no information. Without this every random username in
+        # a credential-stuffing run would add a row for good.
+        self._connect().execute('DELETE FROM buckets WHERE updated < ?', (now - self._refill,))
+
+
+def storage_from_url(url):
+    if url == 'memory://':
+        return MemoryStorage()
+    if url.startswith('sqlite:///'):
+        return SQLiteStorage(url[len('sqlite:///'):])
+    raise ValueError('Unsupported RATELIMIT_STORAGE_URL: %r' % url)
+
+
+class RateLimiter(object):
+    """Token-bucket limits for form POSTs, checked before the view runs.
+
+    RATELIMIT_IP and RATELIMIT_USERNAME are ``(capacity, period)`` pairs: a
+    burst of ``capacity`` attempts, refilled at ``capacity`` per ``period``
+    seconds. RATELIMIT_STORAGE_URL is ``memory://`` (one process) or
+    ``sqlite:////path/to/file`` (all workers on the host); a storage object
+    with a ``take(key, capacity, rate, now)`` method can be passed instead.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('RATELIMIT_ENABLED', True)
+        app.config.setdefault('RATELIMIT_STORAGE_URL', 'memory://')
+        app.config.setdefault('RATELIMIT_IP', (30, 60))
+        app.config.setdefault('RATELIMIT_USERNAME', (5, 60))
+        self.enabled = app.config['RATELIMIT_ENABLED']
+        storage = app.config['RATELIMIT_STORAGE_URL']
+        self.storage = storage_from_url(storage) if isinstance(storage, str) else storage
+        self.limits = {'ip': app.config['RATELIMIT_IP'], 'username': app.config['RATELIMIT_USERNAME']}
+        app.extensions['rate_limiter'] = self
+
+    def _check(self, scope, key):
+        capacity, period = self.limits[scope]
+        rate = capacity / float(period)
+        allowed, tokens = self.storage.take('%s:%s' % (scope, key), capacity, rate, time.time())
+        return allowed, (1 - tokens) / rate
+
+    def limit(self, view):
+        @functools.wraps(view)
+        def wrapped_view(**kwargs):
+            if self.enabled and request.method == 'POST':
+                checks = [('ip', '%s:%s' % (view.__name__, request.remote_addr))]
+                username = request.form.get('username')
+                if username:
+                    checks.append(('username', '%s:%s' % (view.__name__, username.lower())))
+                for scope, key in checks:
+                    allowed, retry_after = self._check(scope, key)
+                    if not allowed:
+                        return ('Too many attempts, please try again later.', 429,
+                                {'Retry-After': str(int(retry_after) + 1), 'Content-Type': 'text/plain'})
+            return view(**kwargs)
+        return wrapped_view
@@ -0,0 +1,134 @@
+import threading
+import time
+
+from flask import g, has_app_context, request, session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import text
+from sqlalchemy.sql.dml import UpdateBase
+
+REPLICA_BIND = 'replica'
+
+# Seconds the replica is behind, per dialect. On Postgres a standby that has
+# replayed everything it received is current however old its last
+# transaction is.
+LAG_SQL = {
+    'postgresql': ("SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+                   "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"),
+}
+
+
+class RoutingSession(Session):
+    """Sends reads to the replica bind while ``g.read_replica`` is set and
+    everything else to the usual bind.
+
+    Flushes and INSERT/UPDATE/DELETE statements always go to the primary, and
+    mark the request as having written: later reads in the same request stay
+    on the primary, and so do the user's next requests for a while.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and has_app_context():
+            if self._flushing or isinstance(clause, UpdateBase):
+                g.wrote_primary = True
+                g.read_replica = False
+            elif g.get('read_replica'):
+                return self._db.engines[REPLICA_BIND]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+class Replicas(object):
+    """Read/write splitting for GET views.
+
+    When SQLALCHEMY_REPLICA_URI is set it becomes the ``replica`` bind, and
+    GET/HEAD requests to REPLICA_ENDPOINTS read from it. A user who wrote
+    anything reads from the primary for REPLICA_STICKY_SECONDS afterwards.
+    Everyone reads from the primary while the replica is more than
+    REPLICA_MAX_LAG seconds behind or can't be reached. The lag is checked
+    at most every REPLICA_LAG_CHECK_INTERVAL seconds per process, with
+    REPLICA_LAG_SQL or the dialect's default query; SQLite files have no
+    replication, so there it is 0 unless REPLICA_LAG_SQL says otherwise.
+
+    Must be created before ``db.init_app`` so the bind is configured.
+    """
+
+    def __init__(self, app=None):
+        self._lag = 0.0
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('SQLALCHEMY_REPLICA_URI', None)
+        app.config.setdefault('REPLICA_ENDPOINTS', ('note_index', 'users_dashboard', 'roles_dashboard',
+                                                    'departments_dashboard'))
+        app.config.setdefault('REPLICA_STICKY_SECONDS', 5)
+        app.config.setdefault('REPLICA_MAX_LAG', 2.0)
+        app.config.setdefault('REPLICA_LAG_CHECK_INTERVAL', 1.0)
+        app.config.setdefault('REPLICA_LAG_SQL', None)
+        self.app = app
+        self.logger = app.logger.getChild('replicas')
+        app.extensions['replicas'] = self
+        if not app.config['SQLALCHEMY_REPLICA_URI']:
+            return
+        binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+        binds[REPLICA_BIND] = app.config['SQLALCHEMY_REPLICA_URI']
+        app.config['SQLALCHEMY_BINDS'] = binds
+        app.before_request(self._choose)
+        app.after_request(self._remember_write)
+
+    def engine(self):
+        return self.app.extensions['sqlalchemy'].engines[REPLICA_BIND]
+
+    def lag(self):
+        """Seconds the replica is behind, or None if it can't be reached."""
+        now = time.monotonic()
+        if now - self._checked < self.app.config['REPLICA_LAG_CHECK_INTERVAL']:
+            return self._lag
+        with self._lock:
+            if now - self._checked < self.app.config['REPLICA_LAG_CHECK_INTERVAL']:
+                return self._lag
+            engine = self.engine()
+            sql = self.app.config['REPLICA_LAG_SQL'] or LAG_SQL.get(engine.dialect.name, 'SELECT 0')
+            try:
+                with engine.connect() as connection:
+                    self._lag = float(connection.execute(text(sql)).scalar() or 0)
+            except Exception:
+                self.logger.warning('Replica lag check failed, reading from the primary', exc_info=True)
+                self._lag = None
+            self._checked = now
+            return self._lag
+
+    def _choose(self):
+        g.read_replica = False
+        if request.method not in ('GET', 'HEAD') or request.endpoint not in self.app.config['REPLICA_ENDPOINTS']:
+            return
+        if session.get('_primary_until', 0) > time.time():
+            return
+        lag = self.lag()
+        if lag is None or lag > self.app.config['REPLICA_MAX_LAG']:
+            return
+        g.read_replica = True
+
+    def _remember_write(self, response):
+        if g.get('wrote_primary'):
+            session['_primary_until'] = time.time() + self.app.config['REPLICA_STICKY_SECONDS']
+        return response
+
+    def copy_sqlite(self):
+        """Copy the primary SQLite database over the replica file, for trying
+        the routing locally with two SQLite files."""
+        db = self.app.extensions['sqlalchemy']
+        primary, replica = db.engines[None], self.engine()
+        if primary.dialect.name != 'sqlite' or replica.dialect.name != 'sqlite':
+            raise ValueError('Both the primary and the replica must be SQLite files.')
+        import sqlite3
+        replica.dispose()
+        source = sqlite3.connect(primary.url.database)
+        target = sqlite3.connect(replica.url.database)
+        try:
+            # The backup API copies a consistent snapshot even mid-write.
+            source.backup(target)
+        finally:
+            source.close()
+            target.close()
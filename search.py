@@ -0,0 +1,83 @@
+from sqlalchemy import DDL, event, text
+
+from .models import db, Note, EXCERPT_LENGTH
+
+# Postgres keeps a generated tsvector on note itself, SQLite (tests and dev)
+# an FTS5 external-content table kept in sync by triggers. The same
+# statements are run by the migration that introduced search.
+POSTGRES_DDL = [
+    "ALTER TABLE note ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(body, '')), 'B')) STORED",
+    "CREATE INDEX ix_note_search_vector ON note USING gin (search_vector)",
+]
+
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE note_fts USING fts5(title, body, content='note', content_rowid='id')",
+    "CREATE TRIGGER note_fts_ai AFTER INSERT ON note BEGIN "
+    "INSERT INTO note_fts(rowid, title, body) VALUES (new.id, new.title, new.body); END",
+    "CREATE TRIGGER note_fts_ad AFTER DELETE ON note BEGIN "
+    "INSERT INTO note_fts(note_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body); END",
+    "CREATE TRIGGER note_fts_au AFTER UPDATE OF title, body ON note BEGIN "
+    "INSERT INTO note_fts(note_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body); "
+    "INSERT INTO note_fts(rowid, title, body) VALUES (new.id, new.title, new.body); END",
+    "INSERT INTO note_fts(note_fts) VALUES ('rebuild')",
+]
+
+for statement in POSTGRES_DDL:
+    event.listen(Note.__table__, 'after_create', DDL(statement).execute_if(dialect='postgresql'))
+for statement in SQLITE_DDL:
+    event.listen(Note.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+# The triggers go with the note table, the FTS table has to be dropped itself.
+event.listen(Note.__table__, 'after_drop', DDL("DROP TABLE IF EXISTS note_fts").execute_if(dialect='sqlite'))
+
+
+POSTGRES_QUERY = text("""
+    SELECT note.id, note.title, substr(note.body, 1, :excerpt) AS excerpt,
+           ts_rank(note.search_vector, query) AS rank
+    FROM note, websearch_to_tsquery('english', :q) AS query
+    WHERE note.user_id = :user_id AND note.search_vector @@ query
+    ORDER BY rank DESC, note.id DESC
+    LIMIT :limit OFFSET :offset
+""")
+
+# bm25() is lower-is-better.
+SQLITE_QUERY = text("""
+    SELECT note.id, note.title, substr(note.body, 1, :excerpt) AS excerpt,
+           bm25(note_fts, 2.0, 1.0) AS rank
+    FROM note_fts JOIN note ON note.id = note_fts.rowid
+    WHERE note_fts MATCH :q AND note.user_id = :user_id
+    ORDER BY rank, note.id DESC
+    LIMIT :limit OFFSET :offset
+""")
+
+
+def fts5_query(q):
+    # Quote every term so user input can't be parsed as FTS5 syntax; the last
+    # term is a prefix match, which is what people expect while typing.
+    terms = ['"%s"' % term.replace('"', '""') for term in q.split()]
+    if terms:
+        terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def search_notes(user_id, q, page=1, per_page=20):
+    """Return ``(rows, has_next)`` for one page of ``user_id``'s notes
+    matching ``q``, best match first. Rows have id, title, excerpt, rank."""
+    q = (q or '').strip()
+    if not q:
+        return [], False
+
+    if db.engine.dialect.name == 'postgresql':
+        query = POSTGRES_QUERY
+    else:
+        query, q = SQLITE_QUERY, fts5_query(q)
+
+    rows = db.session.execute(query, {
+        'q': q,
+        'user_id': user_id,
+        'excerpt': EXCERPT_LENGTH,
+        'limit': per_page + 1,
+        'offset': (page - 1) * per_page,
+    }).fetchall()
+    return rows[:per_page], len(rows) > per_page
@@ -0,0 +1,232 @@
+import hashlib
+import json
+import os
+import secrets
+import time
+
+from flask.sessions import SessionInterface, SessionMixin
+from itsdangerous import BadSignature, Signer
+from werkzeug.datastructures import CallbackDict
+
+from .sqlitelocal import LocalConnections
+
+
+class PeriodicPurge(object):
+    """For stores that only skip expired entries on read: every
+    ``purge_every`` writes in a process also call the store's purge()."""
+
+    purge_every = 1000
+    _writes = 0
+
+    def _wrote(self):
+        self._writes += 1
+        if self._writes % self.purge_every == 0:
+            self.purge()
+
+
+class SQLiteStore(PeriodicPurge):
+    """Key/value store with per-entry expiry in a local SQLite file."""
+
+    def __init__(self, path):
+        self.path = path
+        self._connections = LocalConnections(path)
+        self._connect().execute('CREATE TABLE IF NOT EXISTS store '
+                                '(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)')
+
+    def _connect(self):
+        return self._connections.get()
+
+    def get(self, key):
+        row = self._connect().execute('SELECT value, expires FROM store WHERE key = ?', (key,)).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return json.loads(row[0])
+
+    def set(self, key, value, ttl):
+        self._connect().execute('INSERT OR REPLACE INTO store (key, value, expires) VALUES (?, ?, ?)',
+                                (key, json.dumps(value), time.time() + ttl))
+        self._wrote()
+
+    def delete(self, *keys):
+        self._connect().executemany('DELETE FROM store WHERE key = ?', [(key,) for key in keys])
+
+    def purge(self):
+        self._connect().execute('DELETE FROM store WHERE expires < ?', (time.time(),))
+
+
+class FileSystemStore(PeriodicPurge):
+    """Key/value store with per-entry expiry, one JSON file per key."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha1(key.encode('utf-8')).hexdigest())
+
+    def get(self, key):
+        try:
+            with open(self._path(key)) as f:
+                expires, value = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if expires < time.time():
+            return None
+        return value
+
+    def set(self, key, value, ttl):
+        path = self._path(key)
+        tmp = '%s.%d.tmp' % (path, os.getpid())
+        with open(tmp, 'w') as f:
+            json.dump([time.time() + ttl, value], f)
+        os.replace(tmp, path)
+        self._wrote()
+
+    def delete(self, *keys):
+        for key in keys:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def purge(self):
+        for name in os.listdir(self.directory):
+            if name.endswith('.tmp'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path) as f:
+                    expires, _ = json.load(f)
+                if expires < time.time():
+                    os.remove(path)
+            except (OSError, ValueError):
+                continue
+
+
+def store_from_url(url):
+    if url.startswith('sqlite:///'):
+        return SQLiteStore(url[len('sqlite:///'):])
+    if url.startswith('file://'):
+        return FileSystemStore(url[len('file://'):])
+    raise ValueError('Unsupported SESSION_STORE_URL: %r' % url)
+
+
+class ServerSideSession(CallbackDict, SessionMixin):
+    def __init__(self, initial=None, sid=None):
+        def on_update(self):
+            self.modified = True
+        CallbackDict.__init__(self, initial, on_update)
+        self.sid = sid
+        self.modified = False
+        self.regenerate = False
+
+    def clear(self):
+        # Cleared on log in and log out: hand out a fresh id so an id seen
+        # before authentication can't be reused after it.
+        super().clear()
+        self.regenerate = True
+
+
+class ServerSideSessionInterface(SessionInterface):
+    """Keeps session data in a store; the cookie only carries a signed id."""
+
+    key_prefix = 'session:'
+
+    def __init__(self, store):
+        self.store = store
+
+    def _signer(self, app):
+        return Signer(app.secret_key, salt='server-side-session')
+
+    def open_session(self, app, request):
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if cookie:
+            try:
+                sid = self._signer(app).unsign(cookie).decode('utf-8')
+            except BadSignature:
+                sid = None
+            if sid:
+                data = self.store.get(self.key_prefix + sid)
+                if data is not None:
+                    return ServerSideSession(data, sid=sid)
+        return ServerSideSession(sid=secrets.token_urlsafe(32))
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if session.regenerate:
+            self.store.delete(self.key_prefix + session.sid)
+            session.sid = secrets.token_urlsafe(32)
+        if not session:
+            if session.modified:
+                self.store.delete(self.key_prefix + session.sid)
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+        if not self.should_set_cookie(app, session) and not session.regenerate:
+            return
+
+        ttl = int(app.permanent_session_lifetime.total_seconds())
+        self.store.set(self.key_prefix + session.sid, dict(session), ttl)
+        response.set_cookie(
+            name,
+            self._signer(app).sign(session.sid.encode('utf-8')).decode('utf-8'),
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app),
+        )
+
+
+class Principal(object):
+    """What most requests need to know about the logged-in user, cached so
+    they don't have to load the User row, its roles and departments."""
+
+    def __init__(self, id, username, role_names, department_ids):
+        self.id = id
+        self.username = username
+        self.role_names = role_names
+        self.department_ids = department_ids
+        self.is_admin = any('Admin' in name for name in role_names)
+
+    @classmethod
+    def from_user(cls, user):
+        return cls(user.id, user.username,
+                   [role.name for role in user.roles],
+                   [department.id for department in user.departments])
+
+    def to_dict(self):
+        return {'id': self.id, 'username': self.username,
+                'role_names': self.role_names, 'department_ids': self.department_ids}
+
+    def __eq__(self, other):
+        return getattr(other, 'id', None) == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+
+class PrincipalCache(object):
+    """Principals by user id, expiring after PRINCIPAL_TTL seconds. Views that
+    change a user's name, roles or departments call invalidate()."""
+
+    key_prefix = 'principal:'
+
+    def __init__(self, store, ttl):
+        self.store = store
+        self.ttl = ttl
+
+    def get(self, user_id):
+        data = self.store.get(self.key_prefix + str(user_id))
+        return Principal(**data) if data else None
+
+    def set(self, principal):
+        self.store.set(self.key_prefix + str(principal.id), principal.to_dict(), self.ttl)
+
+    def invalidate(self, user_ids):
+        keys = [self.key_prefix + str(user_id) for user_id in user_ids]
+        if keys:
+            self.store.delete(*keys)
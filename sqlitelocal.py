@@ -0,0 +1,21 @@
+import os
+import sqlite3
+import threading
+
+
+class LocalConnections(object):
+    """One autocommit connection to a local SQLite file per thread, reopened
+    after a fork, in WAL mode so every worker on the host can share the file."""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+
+    def get(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
@@ -25,6 +25,44 @@ document.addEventListener('DOMContentLoaded', function () {
     });
   }
 
-  // Initialize syntax highlighting
-  hljs.initHighlightingOnLoad();
+  // Username fields fill their <datalist> from the search API as you type.
+  Array.prototype.slice.call(document.querySelectorAll('input[data-typeahead]'), 0).forEach(function($el) {
+    var $list = document.getElementById($el.getAttribute('list')),
+      timer = null,
+      latest = 0;
+
+    $el.addEventListener('input', function() {
+      clearTimeout(timer);
+      timer = setTimeout(function() {
+        var query = $el.value.trim(),
+          sent = ++latest;
+        if (!query) {
+          $list.innerHTML = '';
+          return;
+        }
+        var url = $el.dataset.typeahead + ($el.dataset.typeahead.indexOf('?') < 0 ? '?' : '&') +
+          'q=' + encodeURIComponent(query);
+        fetch(url, {credentials: 'same-origin'})
+          .then(function(response) { return response.ok ? response.json() : {users: []}; })
+          .then(function(data) {
+            // Drop answers to queries that have since been superseded.
+            if (sent !== latest) {
+              return;
+            }
+            $list.innerHTML = '';
+            data.users.forEach(function(user) {
+              var $option = document.createElement('option');
+              $option.value = user.username;
+              $list.appendChild($option);
+            });
+          });
+      }, 200);
+    });
+  });
+
+  // Code blocks are highlighted on the server when Pygments is installed;
+  // highlight.js is only loaded otherwise.
+  if (window.hljs) {
+    hljs.initHighlightingOnLoad();
+  }
 });
@@ -0,0 +1,141 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from flask import g
+from jinja2 import FileSystemBytecodeCache, TemplateError, nodes
+from jinja2.ext import Extension
+
+
+def init_templates(app):
+    """Share compiled templates between workers and, optionally, compile them
+    all up front instead of on the first request that uses each one.
+
+    TEMPLATE_CACHE_DIR holds Jinja bytecode keyed by template name and source
+    checksum, so edited templates are recompiled; None disables it.
+    TEMPLATE_PRECOMPILE loads everything in templates/ during create_app.
+    """
+    app.config.setdefault('TEMPLATE_CACHE_DIR', os.path.join(app.instance_path, 'jinja'))
+    app.config.setdefault('TEMPLATE_PRECOMPILE', False)
+
+    cache_dir = app.config['TEMPLATE_CACHE_DIR']
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+
+    if app.config['TEMPLATE_PRECOMPILE']:
+        started = time.perf_counter()
+        names = precompile(app)
+        app.logger.info('Precompiled %d templates in %.1f ms', len(names),
+                        (time.perf_counter() - started) * 1000)
+
+
+def precompile(app):
+    """Load every template of the app itself into the environment's cache.
+    Templates that fail to compile are logged and left to fail when used."""
+    names = []
+    for name in app.jinja_loader.list_templates():
+        if not name.endswith('.html'):
+            continue
+        try:
+            app.jinja_env.get_template(name)
+        except TemplateError as e:
+            app.logger.warning('Could not precompile %s: %s', name, e)
+            continue
+        names.append(name)
+    return names
+
+
+class FragmentCache(object):
+    """Rendered template fragments, kept in memory by each worker.
+
+    ``{% cache 'navbar', g.user.id %}...{% endcache %}`` renders its body once
+    per key and FRAGMENT_CACHE_TIMEOUT seconds (``timeout=`` overrides it).
+    Every key also carries a version counter; views that change users, roles
+    or departments call bump() to retire every fragment at once. The counter
+    lives in ``store`` (the SESSION_STORE_URL store) when there is one, so a
+    bump reaches all workers; otherwise only the current one.
+    """
+
+    version_key = 'fragments:version'
+
+    def __init__(self, app=None, store=None):
+        self.store = store
+        self._version = 0
+        self._fragments = OrderedDict()
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('FRAGMENT_CACHE_ENABLED', True)
+        app.config.setdefault('FRAGMENT_CACHE_TIMEOUT', 300)
+        app.config.setdefault('FRAGMENT_CACHE_MAX_ENTRIES', 10000)
+        self.enabled = app.config['FRAGMENT_CACHE_ENABLED']
+        self.timeout = app.config['FRAGMENT_CACHE_TIMEOUT']
+        self.max_entries = app.config['FRAGMENT_CACHE_MAX_ENTRIES']
+        app.jinja_env.add_extension(FragmentCacheExtension)
+        app.jinja_env.fragment_cache = self
+        app.extensions['fragment_cache'] = self
+
+    def version(self):
+        # Read once per request: a page renders many fragments.
+        if 'fragment_version' not in g:
+            if self.store is not None:
+                g.fragment_version = self.store.get(self.version_key) or 0
+            else:
+                g.fragment_version = self._version
+        return g.fragment_version
+
+    def bump(self):
+        if self.store is not None:
+            self.store.set(self.version_key, (self.store.get(self.version_key) or 0) + 1, 365 * 24 * 3600)
+        else:
+            self._version += 1
+        with self._lock:
+            self._fragments.clear()
+        g.pop('fragment_version', None)
+
+    def get_or_render(self, parts, timeout, render):
+        if not self.enabled:
+            return render()
+        key = '%s:%s' % (self.version(), ':'.join(str(part) for part in parts))
+        now = time.time()
+        with self._lock:
+            entry = self._fragments.get(key)
+            if entry is not None and entry[0] > now:
+                self._fragments.move_to_end(key)
+                return entry[1]
+        value = render()
+        with self._lock:
+            self._fragments[key] = (now + (timeout or self.timeout), value)
+            self._fragments.move_to_end(key)
+            while len(self._fragments) > self.max_entries:
+                self._fragments.popitem(last=False)
+        return value
+
+
+class FragmentCacheExtension(Extension):
+    tags = {'cache'}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        parts = []
+        timeout = nodes.Const(None)
+        first = True
+        while parser.stream.current.type != 'block_end':
+            if not first:
+                parser.stream.expect('comma')
+            first = False
+            if parser.stream.current.test('name:timeout') and parser.stream.look().test('assign'):
+                parser.stream.skip(2)
+                timeout = parser.parse_expression()
+            else:
+                parts.append(parser.parse_expression())
+        body = parser.parse_statements(('name:endcache',), drop_needle=True)
+        call = self.call_method('_render', [nodes.List(parts), timeout])
+        return nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+
+    def _render(self, parts, timeout, caller):
+        return self.environment.fragment_cache.get_or_render(parts, timeout, caller)
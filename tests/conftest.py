@@ -0,0 +1,37 @@
+import pytest
+
+from .. import create_app
+from ..models import Role, User, db
+
+
+@pytest.fixture
+def app():
+    app = create_app({
+        'TESTING': True,
+        'SECRET_KEY': 'test',
+        'SQLALCHEMY_DATABASE_URI': 'sqlite://',
+        'USER_ENABLE_EMAIL': False,
+    })
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    client = app.test_client()
+    client.post('/sign_up', data={'username': 'alice', 'password': 'secret'})
+    client.post('/log_in', data={'username': 'alice', 'password': 'secret'})
+    return client
+
+
+@pytest.fixture
+def admin(app, client):
+    with app.app_context():
+        user = User.query.filter_by(username='alice').one()
+        user.roles.append(Role(name='Admin'))
+        db.session.commit()
+    return client
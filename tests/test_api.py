@@ -0,0 +1,73 @@
+from ..models import Department, Role, User, db
+
+
+def create_note(client, title, body=''):
+    response = client.post('/api/v1/notes', json={'title': title, 'body': body})
+    assert response.status_code == 201
+    return response
+
+
+def test_note_not_modified(client):
+    created = create_note(client, 'First')
+    url, etag = created.headers['Location'], created.headers['ETag']
+
+    response = client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+
+
+def test_stale_if_match(client):
+    created = create_note(client, 'First')
+    url, etag = created.headers['Location'], created.headers['ETag']
+
+    updated = client.patch(url, json={'body': 'Changed'}, headers={'If-Match': etag})
+    assert updated.status_code == 200
+    assert updated.headers['ETag'] != etag
+
+    response = client.patch(url, json={'body': 'Lost update'}, headers={'If-Match': etag})
+    assert response.status_code == 412
+    assert client.get(url).get_json()['body'] == 'Changed'
+
+
+def test_note_list_cursors(client):
+    for i in range(5):
+        create_note(client, 'Note %d' % i)
+
+    first = client.get('/api/v1/notes?per_page=2').get_json()
+    assert first['prev'] is None
+    second = client.get('/api/v1/notes?per_page=2&after=%s' % first['next']).get_json()
+    third = client.get('/api/v1/notes?per_page=2&after=%s' % second['next']).get_json()
+    assert third['next'] is None
+
+    ids = [note['id'] for page in (first, second, third) for note in page['notes']]
+    assert len(ids) == 5 and len(set(ids)) == 5
+
+    back = client.get('/api/v1/notes?per_page=2&before=%s' % second['prev']).get_json()
+    assert back['notes'] == first['notes']
+
+
+def test_bulk_members_idempotent(app, admin):
+    with app.app_context():
+        users = [User(username='user%d' % i, password='x') for i in range(3)]
+        departments = [Department(title='Department %d' % i) for i in range(2)]
+        db.session.add_all(users + departments)
+        db.session.commit()
+        user_ids = [user.id for user in users]
+        department_ids = [department.id for department in departments]
+    payload = {'user_ids': user_ids, 'ids': department_ids}
+
+    assert admin.post('/api/v1/departments/members', json=payload).get_json() == {'added': 6}
+    assert admin.post('/api/v1/departments/members', json=payload).get_json() == {'added': 0}
+    assert admin.delete('/api/v1/departments/members', json=payload).get_json() == {'removed': 6}
+    assert admin.delete('/api/v1/departments/members', json=payload).get_json() == {'removed': 0}
+
+
+def test_bulk_members_needs_admin(app, client):
+    with app.app_context():
+        role = Role(name='Editor')
+        db.session.add(role)
+        db.session.commit()
+        payload = {'user_ids': [1], 'ids': [role.id]}
+
+    assert client.post('/api/v1/roles/members', json=payload).status_code == 403
+    assert app.test_client().post('/api/v1/roles/members', json=payload).status_code == 401
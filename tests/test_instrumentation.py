@@ -0,0 +1,14 @@
+import pytest
+
+from ..instrumentation import QueryBudgetExceeded
+
+
+def test_strict_query_budget(app, client):
+    app.config['QUERY_BUDGETS'] = {'note_index': 1}
+    with pytest.raises(QueryBudgetExceeded):
+        client.get('/notes')
+
+
+def test_within_query_budget(app, client):
+    app.config['QUERY_BUDGETS'] = {'note_index': 20}
+    assert client.get('/notes').status_code == 200